@@ -4,22 +4,25 @@ Facebook Automation App Runner
 Main application runner with scheduling capabilities for continuous Facebook automation.
 Supports both single-run and scheduled execution modes with configurable intervals.
 """
-import os
 import sys
 import time
+import random
 import signal
 import logging
-import schedule
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from typing import Optional, List
 from threading import Event
 from dotenv import load_dotenv
 
 from src.browser.facebook_automation_workflow import (
     FacebookAutomationWorkflow,
-    FacebookConfig,
+    get_facebook_config,
     PostData
 )
+from src.analyzer.text_analyzer import TextAnalyzer
+from db.facebook_database import FacebookDatabase
+from src.config.config import AppSettings
 from src.utils.logger import app_logger
 
 # Load environment variables
@@ -40,18 +43,15 @@ class FacebookAutomationApp:
     def __init__(self):
         """Initialize the Facebook automation application."""
         self.logger = app_logger or logging.getLogger(__name__)
-        self.config = FacebookConfig()
+        self.config = get_facebook_config()
         self.workflow: Optional[FacebookAutomationWorkflow] = None
+        # One connection for the whole process, shared by every workflow run
+        self.db: Optional[FacebookDatabase] = FacebookDatabase() if self.config.save_to_database else None
+        # Likewise one analyzer, so its HTTP session stays warm between runs
+        self.analyzer = TextAnalyzer()
         
-        # Execution settings from environment
-        self.run_mode = os.getenv('RUN_MODE', 'scheduled')  # 'single' or 'scheduled'
-        self.run_interval_minutes = int(os.getenv('RUN_INTERVAL_MINUTES', '60'))
-        self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
-        self.retry_delay_seconds = int(os.getenv('RETRY_DELAY_SECONDS', '300'))
-        
-        # Daily limits from environment
-        self.daily_post_limit = int(os.getenv('DAILY_POST_LIMIT', '100'))
-        self.daily_comment_limit = int(os.getenv('DAILY_COMMENT_LIMIT', '50'))
+        # Execution settings and daily limits, read from the environment once
+        self.settings = AppSettings.from_env()
         
         # Statistics tracking
         self.stats = {
@@ -65,7 +65,8 @@ class FacebookAutomationApp:
             'daily_comments_posted': 0,
             'last_run_time': None,
             'next_run_time': None,
-            'errors': []
+            # Most recent errors only, so a long-running process doesn't grow without bound
+            'errors': deque(maxlen=self.settings.error_log_cap)
         }
         
         # Control flags
@@ -73,28 +74,37 @@ class FacebookAutomationApp:
         self.is_running = False
         
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        try:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+        except ValueError:
+            # Only the main thread may install handlers; embedders use request_shutdown() instead
+            self.logger.debug("Not in main thread; skipping signal handlers")
         
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
-        self.logger.info(f"Received signal {signum}. Initiating graceful shutdown...")
+        self.logger.info("Received signal %s. Initiating graceful shutdown...", signum)
+        self.shutdown_event.set()
+
+    def request_shutdown(self):
+        """Ask a running app to stop after its current step, e.g. from another thread."""
+        self.logger.info("Shutdown requested. Initiating graceful shutdown...")
         self.shutdown_event.set()
         
     def start(self):
         """Start the Facebook automation application."""
         self.logger.info("=" * 60)
         self.logger.info("Facebook Automation App Starting")
-        self.logger.info(f"Run Mode: {self.run_mode}")
-        self.logger.info(f"Pages to monitor: {', '.join(self.config.facebook_pages)}")
-        self.logger.info(f"Max posts per page: {self.config.max_posts_per_page}")
-        self.logger.info(f"Comments enabled: {self.config.enable_comments}")
+        self.logger.info("Run Mode: %s", self.settings.run_mode)
+        self.logger.info("Pages to monitor: %s", ', '.join(self.config.facebook_pages))
+        self.logger.info("Max posts per page: %s", self.config.max_posts_per_page)
+        self.logger.info("Comments enabled: %s", self.config.enable_comments)
         
-        if self.run_mode == 'single':
+        if self.settings.run_mode == 'single':
             self.logger.info("Running single execution...")
             self._run_single()
         else:
-            self.logger.info(f"Running scheduled execution every {self.run_interval_minutes} minutes")
+            self.logger.info("Running scheduled execution every %s minutes", self.settings.run_interval_minutes)
             self._run_scheduled()
             
     def _run_single(self):
@@ -102,39 +112,41 @@ class FacebookAutomationApp:
         try:
             self._execute_workflow_with_retries()
         except Exception as e:
-            self.logger.error(f"Single run failed after all retries: {str(e)}")
+            self.logger.error("Single run failed after all retries: %s", e)
             sys.exit(1)
         finally:
             self.logger.info("Single run finished.")
-            self._print_statistics()
+            self.stop()
 
     def _run_scheduled(self):
         """Run the workflow on a schedule."""
-        # Schedule the job
-        schedule.every(self.run_interval_minutes).minutes.do(self._execute_workflow_with_retries)
-        self.logger.info("Initial job scheduled. First run will start shortly.")
-        
-        # Run the first job immediately
-        self._execute_workflow_with_retries()
-        
+        interval = self.settings.run_interval_minutes * 60
+        # Runs are spaced on a monotonic clock, so wall-clock changes don't shift them.
+        # The first run starts immediately.
+        next_run = time.monotonic()
+        self.logger.info("First run will start shortly.")
+
         while not self.shutdown_event.is_set():
-            next_run = schedule.next_run() 
-            
-            if next_run:
-                self.stats['next_run_time'] = next_run.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                self.stats['next_run_time'] = None
-            
-            schedule.run_pending()
-            time.sleep(1)
-        
+            now = time.monotonic()
+            if now >= next_run:
+                self._execute_workflow_with_retries()
+                next_run = now + interval
+                now = time.monotonic()
+
+            remaining = max(0, next_run - now)
+            self.stats['next_run_time'] = datetime.now() + timedelta(seconds=remaining)
+
+            # Sleep until the next run is due; wakes up immediately when a shutdown is requested
+            if self.shutdown_event.wait(timeout=remaining):
+                break
+
         self.logger.info("Shutdown signal received. Exiting scheduled loop.")
         self.stop()
 
         
     def _execute_workflow_with_retries(self):
         """Execute the workflow with a retry mechanism."""
-        for attempt in range(self.max_retries):
+        for attempt in range(self.settings.max_retries):
 
             if self.shutdown_event.is_set():
                 self.logger.info("Shutdown event set. Exiting orkflow with retries loop.")
@@ -144,12 +156,21 @@ class FacebookAutomationApp:
                 self._execute_workflow()
                 return  # Success, exit retry loop
             except Exception as e:
-                self.logger.error(f"Workflow execution failed on attempt {attempt + 1}/{self.max_retries}. Error: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    self.logger.info(f"Retrying in {self.retry_delay_seconds} seconds...")
-                    time.sleep(self.retry_delay_seconds)
+                self.logger.error("Workflow execution failed on attempt %d/%d. Error: %s", attempt + 1, self.settings.max_retries, e)
+                if attempt < self.settings.max_retries - 1:
+                    # Capped exponential backoff with jitter to avoid hammering a throttled endpoint
+                    delay = min(self.settings.retry_delay_seconds * (2 ** attempt), self.settings.max_backoff_seconds)
+                    delay = random.uniform(delay * 0.5, delay)
+                    self.logger.info("Retrying in %.0f seconds...", delay)
+                    if self.shutdown_event.wait(delay):
+                        self.logger.info("Shutdown event set during retry backoff. Exiting.")
+                        return
                 else:
                     self.logger.error("All retries failed. The workflow will not be executed this cycle.")
+                    # Start the next cycle from a fresh browser
+                    if self.workflow:
+                        self.workflow.close(force_close=True)
+                        self.workflow = None
                     raise
 
     def _execute_workflow(self):
@@ -160,41 +181,60 @@ class FacebookAutomationApp:
 
         self.is_running = True
         self.stats['total_runs'] += 1
-        self.stats['last_run_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.logger.info(f"Starting workflow run #{self.stats['total_runs']}...")
+        now = datetime.now()
+        # Compare against the previous run before overwriting it
+        self._reset_daily_stats_if_needed(now)
+        self.stats['last_run_time'] = now
+        self.logger.info("Starting workflow run #%d...", self.stats['total_runs'])
         
         try:
-            self._reset_daily_stats_if_needed()
-
             # Check daily limits before starting
-            if self.stats['daily_posts_processed'] >= self.daily_post_limit:
-                self.logger.warning(f"Daily post limit of {self.daily_post_limit} reached. Skipping run.")
+            if self.stats['daily_posts_processed'] >= self.settings.daily_post_limit:
+                self.logger.warning("Daily post limit of %d reached. Skipping run.", self.settings.daily_post_limit)
                 return
-            if self.config.enable_comments and self.stats['daily_comments_posted'] >= self.daily_comment_limit:
-                self.logger.warning(f"Daily comment limit of {self.daily_comment_limit} reached. Skipping run.")
+            if self.config.enable_comments and self.stats['daily_comments_posted'] >= self.settings.daily_comment_limit:
+                self.logger.warning("Daily comment limit of %d reached. Skipping run.", self.settings.daily_comment_limit)
                 return
 
-            self.workflow = FacebookAutomationWorkflow(self.config, self.shutdown_event)
-            results = self.workflow.run_workflow()
+            results = self._get_workflow().run_workflow()
             self._update_statistics(results)
             self.stats['successful_runs'] += 1
-            self.logger.info(f"Workflow run #{self.stats['total_runs']} completed successfully.")
+            self.logger.info("Workflow run #%d completed successfully.", self.stats['total_runs'])
 
         except Exception as e:
             self.stats['failed_runs'] += 1
             error_msg = f"An unhandled exception occurred during workflow execution: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
-            self.stats['errors'].append(f"{self.stats['last_run_time']}: {error_msg}")
+            self.stats['errors'].append(f"{self._format_time(self.stats['last_run_time'])}: {error_msg}")
             raise  # Re-raise the exception to be caught by the retry handler
 
         finally:
-            if self.workflow:
-                self.workflow.close()
-                self.workflow = None
             self.is_running = False
             self.logger.info("Workflow run finished.")
             self._print_statistics()
     
+    def _get_workflow(self) -> FacebookAutomationWorkflow:
+        """Return the long-lived workflow, recreating it if its browser is gone."""
+        if self.workflow is not None:
+            if self.workflow.is_healthy():
+                try:
+                    self.workflow.reset_tab_state()
+                    return self.workflow
+                except Exception as e:
+                    self.logger.warning("Failed to reset browser state: %s", e)
+            self.logger.warning("Browser session is unusable. Starting a new one.")
+            self.workflow.close(force_close=True)
+            self.workflow = None
+
+        # The browser is started once and kept across runs; only stop() closes it
+        self.workflow = FacebookAutomationWorkflow(
+            self.config,
+            self.shutdown_event,
+            db=self.db,
+            analyzer=self.analyzer
+        )
+        return self.workflow
+
     def _update_statistics(self, results: List[PostData]):
         """Update run statistics based on workflow results."""
         posts_processed_this_run = len(results)
@@ -215,39 +255,53 @@ class FacebookAutomationApp:
         self.stats['total_comments_posted'] += comments_posted_this_run
         self.stats['daily_comments_posted'] += comments_posted_this_run
         
-        self.logger.info(f"Run summary: Processed {posts_processed_this_run} posts, analyzed {articles_analyzed_this_run} articles, posted {comments_posted_this_run} comments.")
+        self.logger.info(
+            "Run summary: Processed %d posts, analyzed %d articles, posted %d comments.",
+            posts_processed_this_run, articles_analyzed_this_run, comments_posted_this_run
+        )
 
-    def _reset_daily_stats_if_needed(self):
-        """Resets daily counters if a new day has started."""
-        now = datetime.now()
-        last_run_str = self.stats.get('last_run_time')
-        if last_run_str:
-            last_run_time = datetime.strptime(last_run_str, '%Y-%m-%d %H:%M:%S')
-            if last_run_time.date() < now.date():
-                self.logger.info("New day detected. Resetting daily statistics.")
-                self.stats['daily_posts_processed'] = 0
-                self.stats['daily_comments_posted'] = 0
+    def _reset_daily_stats_if_needed(self, now: datetime):
+        """Resets daily counters if a new day has started since the last run."""
+        last_run_time = self.stats['last_run_time']
+        if last_run_time and last_run_time.date() < now.date():
+            self.logger.info("New day detected. Resetting daily statistics.")
+            self.stats['daily_posts_processed'] = 0
+            self.stats['daily_comments_posted'] = 0
+
+    @staticmethod
+    def _format_time(value: Optional[datetime]) -> Optional[str]:
+        """Formats a stats timestamp for display."""
+        return value.strftime('%Y-%m-%d %H:%M:%S') if value else None
 
     def _print_statistics(self):
         """Prints a summary of the current application statistics."""
+        # Skip building the whole block when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        stats = self.stats
         self.logger.info("-" * 60)
         self.logger.info("Application Statistics:")
-        self.logger.info(f"  Total Runs: {self.stats['total_runs']} (Successful: {self.stats['successful_runs']}, Failed: {self.stats['failed_runs']})")
-        self.logger.info(f"  Total Posts Processed: {self.stats['total_posts_processed']}")
-        self.logger.info(f"  Total Comments Posted: {self.stats['total_comments_posted']}")
-        self.logger.info(f"  Total Articles Analyzed: {self.stats['total_articles_analyzed']}")
-        self.logger.info(f"  Daily Posts Processed: {self.stats['daily_posts_processed']}/{self.daily_post_limit}")
-        self.logger.info(f"  Daily Comments Posted: {self.stats['daily_comments_posted']}/{self.daily_comment_limit}")
-        self.logger.info(f"  Last Run Time: {self.stats['last_run_time'] or 'N/A'}")
-        if self.run_mode == 'scheduled':
-            self.logger.info(f"  Next Scheduled Run: {self.stats['next_run_time'] or 'Calculating...'}")
+        self.logger.info("  Total Runs: %d (Successful: %d, Failed: %d)",
+                         stats['total_runs'], stats['successful_runs'], stats['failed_runs'])
+        self.logger.info("  Total Posts Processed: %d", stats['total_posts_processed'])
+        self.logger.info("  Total Comments Posted: %d", stats['total_comments_posted'])
+        self.logger.info("  Total Articles Analyzed: %d", stats['total_articles_analyzed'])
+        self.logger.info("  Daily Posts Processed: %d/%d", stats['daily_posts_processed'], self.settings.daily_post_limit)
+        self.logger.info("  Daily Comments Posted: %d/%d", stats['daily_comments_posted'], self.settings.daily_comment_limit)
+        self.logger.info("  Last Run Time: %s", self._format_time(stats['last_run_time']) or 'N/A')
+        if self.settings.run_mode == 'scheduled':
+            self.logger.info("  Next Scheduled Run: %s", self._format_time(stats['next_run_time']) or 'Calculating...')
         self.logger.info("-" * 60)
         
     def stop(self):
         """Clean up resources and stop the application."""
         self.logger.info("Stopping the application...")
         if self.workflow:
-            self.workflow.close()
+            self.workflow.close(force_close=True)
+            self.workflow = None
+        if self.db:
+            self.db.close()
+        self.analyzer.close()
         self.logger.info("Final statistics:")
         self._print_statistics()
         self.logger.info("Shutdown complete.")
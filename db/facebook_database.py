@@ -1,43 +1,118 @@
 import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Tuple
 from src.config.config import Config
 from src.utils.logger import app_logger
 
+# Statements are kept as module constants so every call hands sqlite3 the same
+# string object and hits its prepared-statement cache
+SQL_CREATE_TABLE = '''
+CREATE TABLE IF NOT EXISTS processed_posts (
+    id TEXT PRIMARY KEY,
+    date TEXT,
+    page TEXT,
+    success INTEGER
+);
+'''
+SQL_CREATE_PAGE_DATE_INDEX = 'CREATE INDEX IF NOT EXISTS idx_posts_page_date ON processed_posts (page, date)'
+SQL_POST_EXISTS = 'SELECT 1 FROM processed_posts WHERE id = ? LIMIT 1'
+SQL_INSERT_POST = 'INSERT OR IGNORE INTO processed_posts (id, date, page, success) VALUES (?, ?, ?, ?)'
+SQL_UPDATE_SUCCESS = 'UPDATE processed_posts SET success = ? WHERE id = ?'
+SQL_ALL_POST_IDS = 'SELECT id FROM processed_posts'
+SQL_COUNT_POSTS = 'SELECT COUNT(*) FROM processed_posts'
+SQL_PAGE_POST_IDS = 'SELECT id FROM processed_posts WHERE page = ?'
+
+# Scraped article texts by URL hash, and LLM analyses by input hash
+SQL_CREATE_ARTICLE_CACHE = '''
+CREATE TABLE IF NOT EXISTS article_cache (
+    url_sha1 TEXT PRIMARY KEY,
+    url TEXT,
+    article_text TEXT,
+    ts REAL
+);
+'''
+SQL_CREATE_ANALYSIS_CACHE = '''
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    key TEXT PRIMARY KEY,
+    analysis_json TEXT,
+    ts REAL
+);
+'''
+SQL_CACHE_ARTICLE = 'INSERT OR REPLACE INTO article_cache (url_sha1, url, article_text, ts) VALUES (?, ?, ?, ?)'
+SQL_RECENT_ARTICLES = 'SELECT url_sha1, article_text FROM article_cache WHERE ts > ? ORDER BY ts DESC LIMIT ?'
+SQL_CACHE_ANALYSIS = 'INSERT OR REPLACE INTO analysis_cache (key, analysis_json, ts) VALUES (?, ?, ?)'
+SQL_RECENT_ANALYSES = 'SELECT key, analysis_json FROM analysis_cache WHERE ts > ? ORDER BY ts DESC LIMIT ?'
+
 class FacebookDatabase:
     """Manages SQLite database for storing processed posts."""
+    EXISTS_CACHE_SIZE = 10_000
+
     def __init__(self):
         self.conn = None
         self.cursor = None
+        # The connection is shared across threads; writes and the shared cursor go through this lock
+        self._write_lock = threading.RLock()
+        # Bounded memo of post_exists results, evicted oldest-first
+        self._exists_cache: Dict[str, bool] = {}
+        self._exists_order = deque()
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._connect()
         self._create_table()
 
     def _connect(self):
         """Connect to SQLite database."""
         Config.DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(Config.DB_PATH)
+        # Autocommit mode; multi-statement work is grouped explicitly with transaction()
+        self.conn = sqlite3.connect(Config.DB_PATH, isolation_level=None, check_same_thread=False)
+        # Rows can be read by column name as well as by index
+        self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
+        # WAL lets reads run alongside writes, and NORMAL sync avoids an fsync per commit
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('PRAGMA synchronous=NORMAL')
+        self.cursor.execute('PRAGMA temp_store=MEMORY')
+        self.cursor.execute('PRAGMA mmap_size=268435456')
+        self.cursor.execute('PRAGMA cache_size=-20000')
+        # Keep dirty pages in memory until commit instead of spilling mid-transaction
+        self.cursor.execute('PRAGMA cache_spill=0')
 
     def _create_table(self):
         """Create the processed_posts table."""
-        create_table_sql = '''
-        CREATE TABLE IF NOT EXISTS processed_posts (
-            id TEXT PRIMARY KEY,
-            date TEXT,
-            page TEXT,
-            success INTEGER
-        );
-        '''
-        self._execute_query(create_table_sql)
+        self._execute_query(SQL_CREATE_TABLE)
+        self._execute_query(SQL_CREATE_PAGE_DATE_INDEX)
+        self._execute_query(SQL_CREATE_ARTICLE_CACHE)
+        self._execute_query(SQL_CREATE_ANALYSIS_CACHE)
 
     def _execute_query(self, query: str, params: tuple = ()):
         """Execute a query with error handling."""
         try:
-            self.cursor.execute(query, params)
-            self.conn.commit()
+            with self._write_lock:
+                self.cursor.execute(query, params)
         except sqlite3.Error as e:
             app_logger.error(f"SQLite error: {e}")
-            self.conn.rollback()
             raise
 
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements in a single transaction (one commit).
+
+        Yields:
+            The database cursor
+        """
+        with self._write_lock:
+            self.cursor.execute('BEGIN')
+            try:
+                yield self.cursor
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.cursor.execute('COMMIT')
+
     def post_exists(self, post_id: str) -> bool:
         """Check if a post exists in the database.
         
@@ -47,38 +122,174 @@ class FacebookDatabase:
         Returns:
             bool: True if post exists, False otherwise
         """
-        query = 'SELECT 1 FROM processed_posts WHERE id = ?'
+        cached = self._exists_cache.get(post_id)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+        self._cache_misses += 1
+
         try:
-            self.cursor.execute(query, (post_id,))
-            result = self.cursor.fetchone()
-            return result is not None
+            # A dedicated cursor, so concurrent readers don't share the write cursor
+            result = self.conn.execute(SQL_POST_EXISTS, (post_id,)).fetchone()
+            exists = result is not None
         except sqlite3.Error as e:
             app_logger.error(f"Error checking if post {post_id} exists: {e}")
             return False
+        self._cache_exists(post_id, exists)
+        return exists
+
+    def all_post_ids(self) -> Iterator[str]:
+        """Yield the IDs of every processed post, streaming rows from a dedicated cursor."""
+        try:
+            for row in self.conn.execute(SQL_ALL_POST_IDS):
+                yield row[0]
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to read post IDs: {e}")
+
+    def get_post_ids(self, page: str) -> Iterator[str]:
+        """Yield the IDs of the processed posts of one page."""
+        try:
+            for row in self.conn.execute(SQL_PAGE_POST_IDS, (page,)):
+                yield row[0]
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to read post IDs of {page}: {e}")
+
+    def post_count(self) -> int:
+        """Return the number of processed posts."""
+        try:
+            return self.conn.execute(SQL_COUNT_POSTS).fetchone()[0]
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to count posts: {e}")
+            return 0
+
+    def _cache_exists(self, post_id: str, exists: bool):
+        """Remember whether a post exists, evicting the oldest entry when full."""
+        with self._write_lock:
+            if post_id not in self._exists_cache:
+                self._exists_order.append(post_id)
+                if len(self._exists_order) > self.EXISTS_CACHE_SIZE:
+                    del self._exists_cache[self._exists_order.popleft()]
+            self._exists_cache[post_id] = exists
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and size of the post_exists cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._exists_cache)
+        }
 
     def insert_post(self, post_id: str, date: str, page: str, success: int) -> bool:
-        """Insert a post into the database."""
-        query = 'INSERT INTO processed_posts (id, date, page, success) VALUES (?, ?, ?, ?)'
+        """Insert a post into the database.
+
+        Returns:
+            bool: True if the post was inserted, False if it already existed or on error
+        """
         try:
-            self._execute_query(query, (post_id, date, page, success))
-            return True
+            with self._write_lock:
+                self._execute_query(SQL_INSERT_POST, (post_id, date, page, success))
+                inserted = self.cursor.rowcount > 0
         except sqlite3.Error:
+            app_logger.error(f"Failed to insert post {post_id}")
+            return False
+        self._cache_exists(post_id, True)
+        if not inserted:
             app_logger.error(f"Post {post_id} already exists")
             return False
+        return True
+
+    def insert_posts(self, rows: Iterable[Tuple[str, str, str, int]]) -> bool:
+        """Insert several posts in a single transaction, ignoring ones that already exist.
+
+        Args:
+            rows: (post_id, date, page, success) tuples
+
+        Returns:
+            bool: True if the batch was written, False on error
+        """
+        rows = list(rows)
+        if not rows:
+            return True
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany(SQL_INSERT_POST, rows)
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to insert {len(rows)} posts: {e}")
+            return False
+        for row in rows:
+            self._cache_exists(row[0], True)
+        return True
 
     def update_post_success(self, post_id: str, success: int) -> bool:
         """Update the success status of a post."""
-        query = 'UPDATE processed_posts SET success = ? WHERE id = ?'
         try:
-            self._execute_query(query, (success, post_id))
+            self._execute_query(SQL_UPDATE_SUCCESS, (success, post_id))
             return True
         except sqlite3.Error:
             app_logger.error(f"Failed to update post {post_id}")
             return False
 
+    def update_posts_success(self, rows: Iterable[Tuple[str, int]]) -> bool:
+        """Update the success status of several posts in a single transaction.
+
+        Args:
+            rows: (post_id, success) tuples
+
+        Returns:
+            bool: True if the batch was written, False on error
+        """
+        params = [(success, post_id) for post_id, success in rows]
+        if not params:
+            return True
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany(SQL_UPDATE_SUCCESS, params)
+            return True
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to update {len(params)} posts: {e}")
+            return False
+
+    def cache_article(self, url_sha1: str, url: str, article_text: str) -> bool:
+        """Store a scraped article text, replacing any older copy."""
+        try:
+            self._execute_query(SQL_CACHE_ARTICLE, (url_sha1, url, article_text, time.time()))
+            return True
+        except sqlite3.Error:
+            app_logger.error(f"Failed to cache article {url}")
+            return False
+
+    def recent_articles(self, max_age_seconds: float, limit: int) -> Dict[str, str]:
+        """Return article texts cached within max_age_seconds, keyed by URL hash."""
+        return self._read_cache(SQL_RECENT_ARTICLES, max_age_seconds, limit)
+
+    def cache_analysis(self, key: str, analysis_json: str) -> bool:
+        """Store a serialized analysis, replacing any older copy."""
+        try:
+            self._execute_query(SQL_CACHE_ANALYSIS, (key, analysis_json, time.time()))
+            return True
+        except sqlite3.Error:
+            app_logger.error(f"Failed to cache analysis {key}")
+            return False
+
+    def recent_analyses(self, max_age_seconds: float, limit: int) -> Dict[str, str]:
+        """Return serialized analyses cached within max_age_seconds, keyed by input hash."""
+        return self._read_cache(SQL_RECENT_ANALYSES, max_age_seconds, limit)
+
+    def _read_cache(self, query: str, max_age_seconds: float, limit: int) -> Dict[str, str]:
+        """Run one of the recent-cache queries and return its (key, value) rows as a dict."""
+        try:
+            rows = self.conn.execute(query, (time.time() - max_age_seconds, limit))
+            return {row[0]: row[1] for row in rows}
+        except sqlite3.Error as e:
+            app_logger.error(f"Failed to read cache: {e}")
+            return {}
+
     def close(self):
         """Close database connections."""
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
\ No newline at end of file
+        with self._write_lock:
+            if self.cursor:
+                self.cursor.close()
+                self.cursor = None
+            if self.conn:
+                self.conn.close()
+                self.conn = None
\ No newline at end of file
@@ -1,20 +1,30 @@
-import requests, json, os
+import requests, json, os, string
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.config.config import Config
-from typing import Dict
+from threading import Event
+from typing import Dict, List, Optional, Tuple
 
 class TextAnalyzer:
     """Analyzes text using OpenRouter.ai models."""
-    def __init__(self, prompt_file: str = os.path.join("prompts.json")):
+    # Parsed prompt files, keyed by path, shared by every instance
+    _prompts_cache: Dict[str, Dict] = {}
+
+    def __init__(self, prompt_file: str = os.path.join("prompts.json"), max_retries: int = 3):
         self.api_key = Config.OPENROUTER_API_KEY
         self.model = Config.OPENROUTER_MODEL
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.max_retries = max_retries
+        self.batch_size = max(1, Config.ANALYZE_BATCH_SIZE)
         
         # Load prompts from JSON file
         try:
-            with open(prompt_file, 'r', encoding='utf-8') as file:
-                prompts = json.load(file)
-                self.system_prompt = prompts["system_prompt"]
-                self.user_prompt = prompts["user_prompt"]
+            prompts = self._load_prompts(prompt_file)
+            self.system_prompt = prompts["system_prompt"]
+            self.user_prompt = prompts["user_prompt"]
+            # Optional: without it, analyze_batch falls back to one request per item
+            self.batch_prompt = prompts.get("batch_prompt")
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {prompt_file} was not found.")
         except KeyError as e:
@@ -22,25 +32,160 @@ class TextAnalyzer:
         except json.JSONDecodeError:
             raise ValueError(f"The file {prompt_file} is not a valid JSON.")
 
-    def analyze(self, post_text: str, article_text: str) -> Dict:
-        """Analyzes a Facebook post and related article text."""
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": self.user_prompt.format(post_text=post_text, article_text=article_text)}
-            ]
-        }
+        # Invariant parts of every request, built once
+        self._base_messages = ({"role": "system", "content": self.system_prompt},)
+        self._user_template = self._compile_prompt(self.user_prompt)
+        self._batch_template = self._compile_prompt(self.batch_prompt) if self.batch_prompt else None
 
-        headers = {
+        # Reuse connections (keep-alive) across calls instead of a new TCP+TLS handshake per post
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=["POST"]
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
-        }
+        })
+
+    def analyze(self, post_text: str, article_text: str, shutdown_event: Optional[Event] = None) -> Dict:
+        """Analyzes a Facebook post and related article text.
+
+        If shutdown_event is set while the reply is streaming, the request is
+        abandoned and the output is empty.
+        """
+        if self._is_empty(post_text, article_text):
+            return {"output": ""}
+        return self._analyze_one(post_text, article_text, shutdown_event)
 
-        response = requests.post(self.api_url, headers=headers, json=payload)
-        response.raise_for_status()
-        result = response.json()
+    def _analyze_one(self, post_text: str, article_text: str, shutdown_event: Optional[Event] = None) -> Dict:
+        """Analyzes a single item with its own chat completion."""
+        messages = (
+            *self._base_messages,
+            {"role": "user", "content": self._user_template.substitute(post_text=post_text, article_text=article_text)}
+        )
 
         return {
-            "output": result["choices"][0]["message"]["content"].strip()
-        }
\ No newline at end of file
+            "output": self._complete(messages, shutdown_event)
+        }
+
+    def analyze_batch(self, items: List[Tuple[str, str]], shutdown_event: Optional[Event] = None) -> List[Dict]:
+        """Analyzes several (post_text, article_text) pairs, packing up to batch_size of them per request.
+
+        Results are returned in the same order as items. Empty items are
+        answered without a request.
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        pending = []
+        for index, (post_text, article_text) in enumerate(items):
+            if self._is_empty(post_text, article_text):
+                results[index] = {"output": ""}
+            else:
+                pending.append(index)
+
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            analyses = self._analyze_chunk([items[index] for index in chunk], shutdown_event)
+            for index, analysis in zip(chunk, analyses):
+                results[index] = analysis
+        return results
+
+    def _analyze_chunk(self, chunk: List[Tuple[str, str]], shutdown_event: Optional[Event] = None) -> List[Dict]:
+        """Analyzes one chunk of items with a single chat completion."""
+        if shutdown_event is not None and shutdown_event.is_set():
+            return [{"output": ""} for _ in chunk]
+        if len(chunk) == 1 or not self._batch_template:
+            return [self._analyze_one(post_text, article_text, shutdown_event) for post_text, article_text in chunk]
+
+        items = [
+            {"i": i, "post": post_text, "article": article_text}
+            for i, (post_text, article_text) in enumerate(chunk)
+        ]
+        messages = (
+            *self._base_messages,
+            {"role": "user", "content": self._batch_template.substitute(items=orjson.dumps(items).decode())}
+        )
+        content = self._complete(messages, shutdown_event)
+        if shutdown_event is not None and shutdown_event.is_set():
+            return [{"output": ""} for _ in chunk]
+
+        try:
+            # Tolerate replies wrapped in a code fence or surrounded by extra text
+            replies = orjson.loads(content[content.index("["):content.rindex("]") + 1])
+            outputs = {int(reply["i"]): str(reply["output"]).strip() for reply in replies}
+        except (ValueError, KeyError, TypeError):
+            # The model did not follow the batch format; analyze each item on its own
+            return [self._analyze_one(post_text, article_text, shutdown_event) for post_text, article_text in chunk]
+
+        return [
+            {"output": outputs[i]} if i in outputs else self._analyze_one(post_text, article_text, shutdown_event)
+            for i, (post_text, article_text) in enumerate(chunk)
+        ]
+
+    def _complete(self, messages: Tuple[Dict, ...], shutdown_event: Optional[Event] = None) -> str:
+        """Streams a chat completion and returns the assistant message content.
+
+        The reply is read as server-sent events, so a set shutdown_event stops
+        the read between chunks. A cancelled reply returns an empty string
+        rather than a truncated one.
+        """
+        data = orjson.dumps({
+            "model": self.model,
+            "messages": messages,
+            "stream": True
+        })
+
+        parts = []
+        with self._session.post(self.api_url, data=data, timeout=(5, 60), stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if shutdown_event is not None and shutdown_event.is_set():
+                    return ""
+                # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank separators
+                if not line.startswith(b"data:"):
+                    continue
+                frame = line[5:].strip()
+                if frame == b"[DONE]":
+                    break
+                chunk = orjson.loads(frame)
+                if "error" in chunk:
+                    raise RuntimeError(f"OpenRouter stream error: {chunk['error'].get('message', chunk['error'])}")
+                for choice in chunk.get("choices", ()):
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        parts.append(content)
+
+        return "".join(parts).strip()
+
+    @staticmethod
+    def _is_empty(post_text: str, article_text: str) -> bool:
+        """True if there is no text at all to analyze."""
+        return not (post_text or "").strip() and not (article_text or "").strip()
+
+    @classmethod
+    def _load_prompts(cls, prompt_file: str) -> Dict:
+        """Reads and parses a prompts file, only once per process."""
+        if prompt_file not in cls._prompts_cache:
+            with open(prompt_file, 'rb') as file:
+                cls._prompts_cache[prompt_file] = json.loads(file.read())
+        return cls._prompts_cache[prompt_file]
+
+    @staticmethod
+    def _compile_prompt(prompt: str) -> string.Template:
+        """Turns a str.format-style prompt ({name} placeholders, {{ }} escapes) into a Template."""
+        # Escaped braces are set aside first, so a literal {{post_text}} is not taken for a placeholder
+        escaped = prompt.replace("$", "$$").replace("{{", "\0").replace("}}", "\1")
+        for name in ("post_text", "article_text", "items"):
+            escaped = escaped.replace("{" + name + "}", "${" + name + "}")
+        return string.Template(escaped.replace("\0", "{").replace("\1", "}"))
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
@@ -5,23 +5,170 @@ Manages Selenium WebDriver setup and provides generic browser automation utiliti
 Simplified version with essential functionality only.
 """
 
+import re
 import time
 import random
-import pickle
+import orjson
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Optional, List, Tuple
+# Cheap constants; the rest of Selenium is imported on first use through _sel()
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.remote.webelement import WebElement
 
+from src.config.config import Config
 from src.utils.logger import app_logger
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+@lru_cache(maxsize=None)
+def _sel() -> SimpleNamespace:
+    """Import the heavy Selenium modules once, when a browser is actually used."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.common.action_chains import ActionChains
+    from selenium.common.exceptions import StaleElementReferenceException
+    return SimpleNamespace(
+        webdriver=webdriver,
+        Service=Service,
+        Options=Options,
+        WebDriverWait=WebDriverWait,
+        EC=expected_conditions,
+        ActionChains=ActionChains,
+        StaleElementReferenceException=StaleElementReferenceException,
+    )
+
+# Runs of ordinary characters, or a single whitespace/punctuation character
+_TYPING_TOKEN_RE = re.compile(r"[^\s.,!?]+|[\s.,!?]")
+
+# Scroll distance per key press, as (pixels, fraction of viewport height)
+_SCROLL_KEY_STEPS = {
+    Keys.DOWN: (40, 0.0),
+    Keys.UP: (-40, 0.0),
+    Keys.PAGE_DOWN: (0, 0.875),
+    Keys.PAGE_UP: (0, -0.875),
+    Keys.SPACE: (0, 0.875),
+}
+
+# Scrolls arguments[0] times inside the page with a random pause after each step,
+# then calls back, so the whole sequence costs a single WebDriver command
+_SCROLL_STEPS_JS = """
+const [times, px, fraction, minMs, maxMs, done] = arguments;
+let i = 0;
+(function step() {
+    if (i++ >= times) { done(); return; }
+    window.scrollBy(0, px + window.innerHeight * fraction);
+    setTimeout(step, minMs + Math.random() * (maxMs - minMs));
+})();
+"""
+
+# Sets an element's text in one command. Inputs and textareas go through the native
+# value setter so React sees the change; contenteditable editors get an insertText edit.
+_SET_TEXT_JS = """
+const [el, text] = arguments;
+el.focus();
+const tag = el.tagName;
+if (tag === 'INPUT' || tag === 'TEXTAREA') {
+    const proto = tag === 'INPUT' ? window.HTMLInputElement.prototype : window.HTMLTextAreaElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+} else {
+    document.execCommand('selectAll', false, null);
+    document.execCommand('insertText', false, text);
+}
+"""
+
+# Reads the requested attributes of every element passed in; 'text' means innerText
+# and 'href' the resolved URL, matching WebElement.text and get_attribute('href')
+_ELEMENT_ATTRS_JS = """
+const [elements, attrs] = arguments;
+return elements.map(e => attrs.map(a =>
+    a === 'text' ? e.innerText : (a === 'href' && e.href ? e.href : e.getAttribute(a))
+));
+"""
+
+# Joins the trimmed, non-empty innerText of every match of arguments[1] under arguments[0]
+_QUERY_TEXT_JOIN_JS = """
+const [root, selector, sep] = arguments;
+return Array.from(root.querySelectorAll(selector))
+    .map(e => e.innerText.trim())
+    .filter(Boolean)
+    .join(sep);
+"""
+
+# Scrolls a post into view, fires mouseover on its links (Facebook fills in the real
+# post link on hover) and returns the href of the link matching arguments[1]
+_POST_LINK_JS = """
+const [post, selector] = arguments;
+post.scrollIntoView({block: 'center'});
+post.querySelectorAll('a').forEach(a => {
+    a.dispatchEvent(new MouseEvent('mouseover', {bubbles: true, cancelable: true, view: window}));
+});
+const link = post.querySelector(selector);
+return link ? link.href : null;
+"""
+
+# Batch form of _POST_LINK_JS for a list of posts, without scrolling: links already
+# in the DOM are read as they are, and mouseover is only fired on posts lacking one
+_POST_LINKS_JS = """
+const [posts, selector] = arguments;
+return posts.map(post => {
+    let link = post.querySelector(selector);
+    if (!link) {
+        post.querySelectorAll('a').forEach(a => {
+            a.dispatchEvent(new MouseEvent('mouseover', {bubbles: true, cancelable: true, view: window}));
+        });
+        link = post.querySelector(selector);
+    }
+    return link ? link.href : null;
+});
+"""
+
+# Returns [index, value] for the first of several CSS selectors whose first match has a
+# non-empty value ('text' is innerText, 'href' the resolved URL), or null if none has
+_FIRST_MATCH_JS = """
+const [selectors, attr] = arguments;
+for (let i = 0; i < selectors.length; i++) {
+    const e = document.querySelector(selectors[i]);
+    if (!e) continue;
+    const value = attr === 'text' ? e.innerText : (attr === 'href' && e.href ? e.href : e.getAttribute(attr));
+    if (value) return [i, value];
+}
+return null;
+"""
+
+# Reports which of several named locators ([by, value] pairs, CSS or XPath) match in the page
+_PROBE_ELEMENTS_JS = """
+const [locators] = arguments;
+const found = {};
+for (const [name, [by, value]] of Object.entries(locators)) {
+    found[name] = by === 'xpath'
+        ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null
+        : document.querySelector(value) !== null;
+}
+return found;
+"""
+
+# Resources not needed for scraping, blocked at the network layer in light headless runs
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*scontent*",  # Facebook's photo/video CDN; its URLs carry query strings, so no extension match
+    "*.woff2", "*.woff", "*.ttf",
+    "*.mp4",
+    "*.css",
+    "*analytics*", "*doubleclick*", "*facebook.com/tr*",
+]
+
 
 class BrowserDriver:
     """
@@ -43,19 +190,27 @@ class BrowserDriver:
             docker_env: Whether to run in Docker environment
             headless: Whether to run in headless mode
         """
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional["webdriver.Chrome"] = None
         self.docker_env = docker_env
         self.headless = headless
         self.logger = app_logger
+        # WebDriverWait objects by timeout, reused across lookups; bound to the current driver
+        self._wait_cache: Dict[float, "WebDriverWait"] = {}
+        # find_elements results by (by, value); dropped whenever the page may have changed
+        self._element_cache: Dict[Tuple[str, str], List["WebElement"]] = {}
 
-    def setup_driver(self) -> webdriver.Chrome:
+    def setup_driver(self) -> "webdriver.Chrome":
         """
         Set up Chrome WebDriver with optimizations.
         
         Returns:
             Configured Chrome WebDriver instance
         """
-        options = Options()
+        # Any cached waits and elements belong to the previous driver
+        self._wait_cache.clear()
+        self._element_cache.clear()
+        sel = _sel()
+        options = sel.Options()
         
         # Essential options
         # Use a consistent screen size
@@ -71,21 +226,33 @@ class BrowserDriver:
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-software-rasterizer")
         options.add_argument("--disable-renderer-backgrounding")
-        options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_argument("--mute-audio")
         options.add_argument("--disable-gpu")
+        
+        # Cut background traffic that scraping never needs
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-translate")
                 
         # Performance optimizations
+        # Return from get() at DOMContentLoaded; anything loaded later is waited for explicitly
+        options.page_load_strategy = "eager"
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        # Hide navigator.webdriver so Facebook serves the regular feed instead of extra checks
+        options.add_argument("--disable-blink-features=AutomationControlled")
         
         # Disable password manager and autofill
         prefs = {
-            "profile.managed_default_content_settings.images": 2,  # Disable image loading for speed
             "credentials_enable_service": False,  # Disable Chrome's login popups
             "profile.password_manager_enabled": False,
             "autofill.profile_enabled": False
         }
+        if Config.SCRAPE_LIGHT:
+            # Text only: never fetch images, in headless and visible runs alike
+            options.add_argument("--blink-settings=imagesEnabled=false")  # Skip image decoding in the renderer
+            prefs["profile.managed_default_content_settings.images"] = 2
         options.add_experimental_option("prefs", prefs)
         
         # Headless mode if specified
@@ -98,17 +265,16 @@ class BrowserDriver:
         # Create driver based on environment
         driver = None
         max_retries = 5
-        retry_delay = 3  # seconds
         for attempt in range(max_retries):
             try:
                 if self.docker_env:
-                    driver = webdriver.Remote(
+                    driver = sel.webdriver.Remote(
                         command_executor="http://selenium:4444/wd/hub",
                         options=options
                     )
                 else:
-                    driver = webdriver.Chrome(
-                        service=Service(),
+                    driver = sel.webdriver.Chrome(
+                        service=sel.Service(),
                         options=options
                     )
                 break  # Success
@@ -116,15 +282,55 @@ class BrowserDriver:
                 self.logger.warning(f"Driver setup attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(retry_delay)
+                # Exponential backoff: retry quickly first, wait longer if the server stays down
+                time.sleep(min(0.2 * (2 ** attempt), 5))
             
+        if self.headless and Config.SCRAPE_LIGHT:
+            self._block_heavy_resources(driver)
+
         driver.set_page_load_timeout(30)
-        driver.implicitly_wait(10)
+        # No implicit wait: lookups that need to wait go through WebDriverWait, and
+        # a global implicit wait would stall every failed lookup for the full timeout
+        driver.implicitly_wait(0)
         self.logger.info("Browser driver initialized successfully")
 
         return driver
 
 
+    def _block_heavy_resources(self, driver: "webdriver.Chrome"):
+        """
+        Stop the browser from downloading images, fonts, media, stylesheets and trackers.
+        
+        Only used in headless mode, so a visible browser still renders normally.
+        Needs CDP, which a remote driver may not offer; in that case nothing is blocked.
+        
+        Args:
+            driver: Newly created WebDriver
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            self.logger.debug("CDP not available; resource blocking skipped")
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            self.logger.warning(f"Failed to block heavy resources: {e}")
+
+    def _wait(self, timeout: float) -> "WebDriverWait":
+        """
+        Get a WebDriverWait for the given timeout, creating it on first use.
+        
+        Args:
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            Cached WebDriverWait bound to the current driver
+        """
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = self._wait_cache[timeout] = _sel().WebDriverWait(self.driver, timeout, poll_frequency=0.3)
+        return wait
+
     def get(self, url: str):
         """
         Navigate to a URL.
@@ -132,10 +338,11 @@ class BrowserDriver:
         Args:
             url: The URL to navigate to
         """
+        self._element_cache.clear()
         self.driver.get(url)
         self.logger.debug(f"Navigated to: {url}")
 
-    def find_element(self, by: By, value: str, timeout: int = 10) -> WebElement:
+    def find_element(self, by: By, value: str, timeout: int = 10) -> "WebElement":
         """
         Find a single element with explicit wait.
         
@@ -150,18 +357,47 @@ class BrowserDriver:
         Raises:
             TimeoutException if element not found within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((by, value))
+        return self._wait(timeout).until(
+            _sel().EC.presence_of_element_located((by, value))
+        )
+
+    def find_all_present(self, locators: List[Tuple[str, str]], timeout: int = 10) -> List["WebElement"]:
+        """
+        Wait until every locator matches, in a single explicit wait.
+        
+        Args:
+            locators: (by, value) pairs
+            timeout: Maximum wait time in seconds for all of them together
+            
+        Returns:
+            The first element matching each locator, in the same order
+            
+        Raises:
+            TimeoutException if any of them is still missing after the timeout
+        """
+        EC = _sel().EC
+        return self._wait(timeout).until(
+            EC.all_of(*(EC.presence_of_element_located(locator) for locator in locators))
         )
 
-    def find_elements(self, by: By, value: str, timeout: int = 10) -> List[WebElement]:
+    def find_elements(
+        self,
+        by: By,
+        value: str,
+        timeout: int = 10,
+        use_cache: bool = True
+    ) -> List["WebElement"]:
         """
         Find multiple elements with explicit wait.
         
+        Results are cached until the next navigation, scroll or tab change.
+        
         Args:
             by: Locator strategy
             value: Locator value
             timeout: Maximum wait time in seconds
+            use_cache: Whether to reuse (and store) cached results; disable for
+                selectors whose matches change while the page is loading
             
         Returns:
             List of WebElements if found
@@ -169,9 +405,94 @@ class BrowserDriver:
         Raises:
             TimeoutException if no elements found within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located((by, value))
+        key = (by, value)
+        if use_cache:
+            cached = self._element_cache.get(key)
+            if cached:
+                try:
+                    cached[0].is_enabled()
+                    return cached
+                except _sel().StaleElementReferenceException:
+                    del self._element_cache[key]
+                    
+        elements = self._wait(timeout).until(
+            _sel().EC.presence_of_all_elements_located((by, value))
         )
+        if use_cache:
+            self._element_cache[key] = elements
+        return elements
+
+    def find_elements_with_attrs(
+        self,
+        by: By,
+        value: str,
+        attrs: List[str],
+        timeout: int = 10
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Find elements and read several attributes of each in one extra round trip.
+        
+        Args:
+            by: Locator strategy
+            value: Locator value
+            attrs: Attribute names to read; 'text' reads the visible text
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            One dict of attribute values per element, in document order
+            
+        Raises:
+            TimeoutException if no elements found within timeout
+        """
+        return self.element_attrs(self.find_elements(by, value, timeout), attrs)
+
+    def element_attrs(
+        self,
+        elements: List["WebElement"],
+        attrs: List[str]
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Read several attributes of already located elements with a single script.
+        
+        Args:
+            elements: WebElements to read
+            attrs: Attribute names to read; 'text' reads the visible text
+            
+        Returns:
+            One dict of attribute values per element
+        """
+        if not elements:
+            return []
+        rows = self.driver.execute_script(_ELEMENT_ATTRS_JS, list(elements), list(attrs))
+        return [dict(zip(attrs, row)) for row in rows]
+
+    def query_text_join(self, root_element: "WebElement", css_selector: str, sep: str = "\n") -> str:
+        """
+        Read and join the text of all descendants matching a selector with a single script.
+        
+        Args:
+            root_element: WebElement to search under
+            css_selector: CSS selector of the elements whose text is read
+            sep: Separator placed between the texts
+            
+        Returns:
+            The joined text; empty blocks are skipped
+        """
+        return self.driver.execute_script(_QUERY_TEXT_JOIN_JS, root_element, css_selector, sep) or ""
+
+    @contextmanager
+    def implicit_wait(self, seconds: float):
+        """
+        Temporarily enable an implicit wait for raw WebElement lookups.
+        
+        Args:
+            seconds: Implicit wait to apply inside the block; reset to 0 on exit
+        """
+        self.driver.implicitly_wait(seconds)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(0)
 
     def scroll(self, times: int = 1, default_key=Keys.DOWN):
         """
@@ -179,57 +500,91 @@ class BrowserDriver:
         
         Args:
             times: Number of scroll actions to perform
-            default_key: Key to use for scrolling
+            default_key: Key whose scroll distance each step emulates
+                (DOWN, UP, PAGE_DOWN, PAGE_UP or SPACE)
         """
+        self._element_cache.clear()
         try:
-            body = self.find_element(By.CSS_SELECTOR, "body")
-            for _ in range(times):
-                body.send_keys(default_key)
-                time.sleep(random.uniform(0.4, 1.0))
+            px, fraction = _SCROLL_KEY_STEPS.get(default_key, _SCROLL_KEY_STEPS[Keys.DOWN])
+            self.driver.execute_async_script(_SCROLL_STEPS_JS, times, px, fraction, 400, 1000)
         except Exception as e:
             self.logger.warning(f"Scroll failed: {str(e)}")
 
-    def scroll_to_element(self, element: WebElement):
+    def scroll_to_element(self, element: "WebElement"):
         """
         Scroll to an element with human-like gradual scrolling.
         
         Args:
             element: WebElement to scroll to
         """
+        # Scrolling can load more content into the feed
+        self._element_cache.clear()
         try:
-            # Get element position
-            element_y = element.location["y"]
-            window_height = self.driver.execute_script("return window.innerHeight")
-            current_scroll = self.driver.execute_script("return window.scrollY")
+            # Get element position and viewport height in one round trip
+            element_y, window_height = self.driver.execute_script(
+                "const r = arguments[0].getBoundingClientRect();"
+                "return [r.top + window.scrollY, window.innerHeight];",
+                element
+            )
             target_scroll = element_y - (window_height // 2)  # Center element
 
-            # Gradual scrolling
-            steps = 5
-            scroll_step = (target_scroll - current_scroll) / steps
-            
-            for _ in range(steps):
-                self.driver.execute_script(f"window.scrollBy(0, {scroll_step});")
-                time.sleep(random.uniform(0.2, 0.5))
-                
-            # Ensure element is in view
-            ActionChains(self.driver).scroll_to_element(element).perform()
+            # Gradual scrolling, done by the browser in a single command
+            self.driver.execute_script(
+                "window.scrollTo({top: arguments[0], behavior: 'smooth'});",
+                target_scroll
+            )
+            time.sleep(random.uniform(0.6, 1.2))
             
         except Exception as e:
             self.logger.warning(f"Failed to scroll to element: {str(e)}")
             # Fallback to simple scroll
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
 
-    def hover_element(self, element: WebElement):
+    def extract_post_link_js(self, element: "WebElement", link_selector: str) -> Optional[str]:
+        """
+        Reveal and read a post's hover-only link with a single script call.
+        
+        Args:
+            element: WebElement of the post
+            link_selector: CSS selector of the link that appears on hover
+            
+        Returns:
+            The link's href, or None if it did not appear
+        """
+        return self.driver.execute_script(_POST_LINK_JS, element, link_selector)
+
+    def extract_post_links_js(self, elements: List["WebElement"], link_selector: str) -> List[Optional[str]]:
+        """
+        Read the links of many posts with a single script call.
+        
+        Args:
+            elements: WebElements of the posts
+            link_selector: CSS selector of the post's link
+            
+        Returns:
+            One href per post, None where no link was found
+        """
+        if not elements:
+            return []
+        return self.driver.execute_script(_POST_LINKS_JS, list(elements), link_selector)
+
+    def hover_element(self, element: "WebElement"):
         """
         Hover over an element.
         
         Args:
             element: WebElement to hover over
         """
-        ActionChains(self.driver).move_to_element(element).perform()
+        _sel().ActionChains(self.driver).move_to_element(element).perform()
         time.sleep(random.uniform(0.3, 0.7))
 
-    def type_with_delay(self, element: WebElement, text: str, enter_after: bool = True):
+    def type_with_delay(
+        self,
+        element: "WebElement",
+        text: str,
+        enter_after: bool = True,
+        human: bool = True
+    ):
         """
         Simulate human-like typing with random delays.
         
@@ -237,28 +592,57 @@ class BrowserDriver:
             element: WebElement to type into
             text: Text to type
             enter_after: Whether to press Enter after typing
+            human: Type with human-like pauses; if False, set the whole text
+                with a single script (for runs where bot detection is not a concern)
         """
+        if not human:
+            self.driver.execute_script(_SET_TEXT_JS, element, text)
+            if enter_after:
+                element.send_keys(Keys.ENTER)
+            return
+            
         element.clear()
         
-        for char in text:
-            if char == "\n":
+        # Words go out in one send_keys call each instead of one call per character
+        tokens = _TYPING_TOKEN_RE.findall(text)
+        
+        # Sample every pause up front, so the send loop only sends and sleeps
+        uniform = random.uniform
+        delays = [
+            uniform(0.2, 0.4) if token == "\n" or token in ".,!?"  # Newline or punctuation
+            else uniform(0.1, 0.3) if token.isspace()
+            else uniform(0.05, 0.15) * len(token)  # Roughly the time it would take to type the word
+            for token in tokens
+        ]
+        
+        send_keys = element.send_keys
+        sleep = time.sleep
+        for token, delay in zip(tokens, delays):
+            if token == "\n":
                 # Handle newlines with SHIFT+ENTER
-                element.send_keys(Keys.SHIFT, Keys.ENTER)
-                time.sleep(random.uniform(0.2, 0.4))
+                send_keys(Keys.SHIFT, Keys.ENTER)
             else:
-                element.send_keys(char)
-                # Variable delay based on character type
-                if char == " ":
-                    time.sleep(random.uniform(0.1, 0.3))
-                elif char in ".,!?":
-                    time.sleep(random.uniform(0.2, 0.4))
-                else:
-                    time.sleep(random.uniform(0.05, 0.15))
+                send_keys(token)
+            sleep(delay)
                     
         if enter_after:
             time.sleep(random.uniform(0.3, 0.7))
             element.send_keys(Keys.ENTER)
 
+    def paste_comment(self, element: "WebElement", text: str, enter_after: bool = True):
+        """
+        Insert a whole comment at once, as a paste would, then submit it.
+        
+        Args:
+            element: Comment box to fill
+            text: Comment text
+            enter_after: Whether to press Enter after a short pause
+        """
+        self.driver.execute_script(_SET_TEXT_JS, element, text)
+        if enter_after:
+            time.sleep(random.uniform(0.5, 1.0))
+            element.send_keys(Keys.ENTER)
+
     def open_new_tab(self, url: Optional[str] = None):
         """
         Open a new tab and optionally navigate to a URL.
@@ -266,6 +650,7 @@ class BrowserDriver:
         Args:
             url: Optional URL to navigate to in the new tab
         """
+        self._element_cache.clear()
         self.driver.execute_script("window.open('');")
         self.driver.switch_to.window(self.driver.window_handles[-1])
         
@@ -274,25 +659,88 @@ class BrowserDriver:
             
         self.logger.debug(f"Opened new tab{f' with URL: {url}' if url else ''}")
 
+    def open_tabs_cdp(self, urls: List[str]) -> List[str]:
+        """
+        Open several URLs in background tabs at once, without switching to them.
+        
+        The tabs load in parallel; switch to one with driver.switch_to.window(handle).
+        
+        Args:
+            urls: URLs to open, one tab each
+            
+        Returns:
+            Window handles of the new tabs, in the order of urls
+        """
+        self._element_cache.clear()
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                # ChromeDriver window handles are the CDP target IDs
+                return [
+                    self.driver.execute_cdp_cmd(
+                        "Target.createTarget", {"url": url, "background": True}
+                    )["targetId"]
+                    for url in urls
+                ]
+            except Exception as e:
+                self.logger.debug(f"CDP tab open failed, falling back to window.open: {e}")
+        
+        # No CDP: open them all with one script and pick out the new handles
+        before = set(self.driver.window_handles)
+        self.driver.execute_script(
+            "for (const url of arguments[0]) window.open(url, '_blank');", list(urls)
+        )
+        return [handle for handle in self.driver.window_handles if handle not in before]
+
+    def close_tabs(self, handles: List[str], switch_to: Optional[str] = None):
+        """
+        Close specific tabs, then switch to another tab.
+        
+        Args:
+            handles: Window handles of the tabs to close
+            switch_to: Handle of the tab to continue in; the first/main tab if None
+        """
+        self._element_cache.clear()
+        main_window = switch_to or self.driver.window_handles[0]
+        for handle in handles:
+            if handle == main_window:
+                continue
+            try:
+                if hasattr(self.driver, "execute_cdp_cmd"):
+                    self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": handle})
+                else:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            except Exception as e:
+                self.logger.debug(f"Failed to close tab {handle}: {e}")
+        self.driver.switch_to.window(main_window)
+
     def close_current_tab(self):
         """Close the current tab and switch to the previous tab."""
-        if len(self.driver.window_handles) > 1:
-            current_index = self.driver.window_handles.index(
-                self.driver.current_window_handle
-            )
+        self._element_cache.clear()
+        handles = self.driver.window_handles
+        if len(handles) > 1:
+            current_index = handles.index(self.driver.current_window_handle)
+            # Previous tab, or the next one when closing the first
+            target = handles[current_index - 1] if current_index > 0 else handles[1]
             self.driver.close()
             
             # Switch to previous tab
-            new_index = max(0, current_index - 1)
-            self.driver.switch_to.window(self.driver.window_handles[new_index])
+            self.driver.switch_to.window(target)
             self.logger.debug("Closed current tab and switched to previous")
         else:
             self.logger.warning("Cannot close the only open tab")
 
     def close_all_other_tabs(self):
         """Close all tabs except the first/main tab."""
+        self._element_cache.clear()
         main_window = self.driver.window_handles[0]
         
+        if self._close_targets_cdp(main_window):
+            self.driver.switch_to.window(main_window)
+            self.logger.debug("Closed all tabs except main")
+            return
+        
+        # No CDP: switch to and close each tab in turn
         while len(self.driver.window_handles) > 1:
             self.driver.switch_to.window(self.driver.window_handles[-1])
             if self.driver.current_window_handle != main_window:
@@ -301,6 +749,28 @@ class BrowserDriver:
         self.driver.switch_to.window(main_window)
         self.logger.debug("Closed all tabs except main")
 
+    def _close_targets_cdp(self, keep_handle: str) -> bool:
+        """
+        Close every page target except one, without switching to each tab.
+        
+        Args:
+            keep_handle: Window handle to keep open (ChromeDriver handles are CDP target IDs)
+            
+        Returns:
+            True if the tabs were closed through CDP, False if CDP is not available
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        try:
+            targets = self.driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+            for target in targets:
+                if target.get("type") == "page" and target["targetId"] != keep_handle:
+                    self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": target["targetId"]})
+            return True
+        except Exception as e:
+            self.logger.debug(f"CDP tab close failed, falling back to switching tabs: {e}")
+            return False
+
     def save_cookies(self, filename: Path):
         """
         Save cookies to a file for session persistence.
@@ -310,8 +780,7 @@ class BrowserDriver:
         """
         filename.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filename, "wb") as f:
-            pickle.dump(self.driver.get_cookies(), f)
+        filename.write_bytes(orjson.dumps(self.driver.get_cookies()))
             
         self.logger.info(f"Cookies saved to {filename}")
 
@@ -329,34 +798,22 @@ class BrowserDriver:
             self.logger.warning(f"Cookies file not found: {filename}")
             return False
             
+        self._element_cache.clear()
         try:
-            # Navigate to Facebook first
-            self.driver.get("https://www.facebook.com")
-            time.sleep(random.uniform(1, 2))
-            
-            # Load cookies
-            with open(filename, "rb") as f:
-                cookies = pickle.load(f)
-            
-            # Add valid cookies
-            current_time = time.time()
-            cookies_added = 0
-            
-            for cookie in cookies:
-                # Check if cookie is for Facebook domain
-                if 'domain' in cookie and 'facebook.com' in cookie['domain']:
-                    # Check if not expired
-                    if 'expiry' not in cookie or cookie['expiry'] > current_time:
-                        try:
-                            self.driver.add_cookie(cookie)
-                            cookies_added += 1
-                        except Exception as e:
-                            self.logger.debug(f"Failed to add cookie: {e}")
+            valid_cookies = self._filter_cookies(orjson.loads(filename.read_bytes()))
+            
+            # CDP sets cookies from any page, so a single navigation applies them
+            cookies_added = self._set_cookies_cdp(valid_cookies)
+            if cookies_added is None:
+                # Plain WebDriver only accepts cookies for the page it is on
+                self.driver.get("https://www.facebook.com")
+                time.sleep(random.uniform(1, 2))
+                cookies_added = self._add_cookies_one_by_one(valid_cookies)
                             
             self.logger.info(f"Loaded {cookies_added} cookies from {filename}")
             
-            # Refresh to apply cookies
-            self.driver.refresh()
+            # (Re)load Facebook with the restored session
+            self.driver.get("https://www.facebook.com")
             time.sleep(random.uniform(2, 3))
             
             return cookies_added > 0
@@ -365,6 +822,87 @@ class BrowserDriver:
             self.logger.error(f"Failed to load cookies: {str(e)}")
             return False
 
+    def add_cookies(self, cookies: List[dict]) -> int:
+        """
+        Add the unexpired Facebook cookies from a list to the browser.
+        
+        Without CDP the browser must already be on a facebook.com page.
+        
+        Args:
+            cookies: Cookies in Selenium's get_cookies() format
+            
+        Returns:
+            Number of cookies added
+        """
+        valid_cookies = self._filter_cookies(cookies)
+        cookies_added = self._set_cookies_cdp(valid_cookies)
+        if cookies_added is None:
+            # No CDP (e.g. a remote grid): add them one by one
+            cookies_added = self._add_cookies_one_by_one(valid_cookies)
+        return cookies_added
+
+    @staticmethod
+    def _filter_cookies(cookies: List[dict]) -> List[dict]:
+        """Keep only unexpired Facebook cookies."""
+        now = time.time()
+        return [
+            cookie for cookie in cookies
+            if 'facebook.com' in cookie.get('domain', '')
+            and cookie.get('expiry', now + 1) > now
+        ]
+
+    def _add_cookies_one_by_one(self, cookies: List[dict]) -> int:
+        """
+        Add cookies through WebDriver, one command each.
+        
+        Args:
+            cookies: Cookies in Selenium's get_cookies() format
+            
+        Returns:
+            Number of cookies added
+        """
+        cookies_added = 0
+        add_cookie = self.driver.add_cookie
+        for cookie in cookies:
+            try:
+                add_cookie(cookie)
+                cookies_added += 1
+            except Exception as e:
+                self.logger.debug(f"Failed to add cookie: {e}")
+        return cookies_added
+
+    def _set_cookies_cdp(self, cookies: List[dict]) -> Optional[int]:
+        """
+        Set all cookies with a single Chrome DevTools command.
+        
+        Args:
+            cookies: Cookies in Selenium's get_cookies() format
+            
+        Returns:
+            Number of cookies set, or None if CDP is not available
+        """
+        if not cookies:
+            return 0
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return None
+        
+        keys = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        params = []
+        append = params.append
+        for cookie in cookies:
+            param = {key: cookie[key] for key in keys if key in cookie}
+            # Selenium calls it expiry, CDP calls it expires
+            if "expiry" in cookie:
+                param["expires"] = cookie["expiry"]
+            append(param)
+            
+        try:
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            return len(params)
+        except Exception as e:
+            self.logger.debug(f"CDP cookie load failed, falling back to add_cookie: {e}")
+            return None
+
     def take_screenshot(self, filename: str = None) -> str:
         """
         Take a screenshot of the current page.
@@ -392,7 +930,7 @@ class BrowserDriver:
         value: str, 
         timeout: int = 10,
         condition: str = "presence"
-    ) -> Optional[WebElement]:
+    ) -> Optional["WebElement"]:
         """
         Wait for an element with specified condition.
         
@@ -406,7 +944,16 @@ class BrowserDriver:
             WebElement if found, None otherwise
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            if condition == "presence" and by == By.CSS_SELECTOR:
+                found = self._wait_cdp(value, timeout)
+                if found is not None:
+                    if not found:
+                        self.logger.debug(f"Element not found: {value}")
+                        return None
+                    return self.driver.find_element(by, value)
+                    
+            wait = self._wait(timeout)
+            EC = _sel().EC
             
             if condition == "clickable":
                 element = wait.until(EC.element_to_be_clickable((by, value)))
@@ -421,6 +968,148 @@ class BrowserDriver:
             self.logger.debug(f"Element not found: {value}")
             return None
 
+    def wait_for_page_load(self, timeout: float = 10) -> bool:
+        """
+        Wait until the current document has finished loading.
+        
+        Args:
+            timeout: Maximum wait time
+            
+        Returns:
+            True if the page loaded in time, False otherwise
+        """
+        try:
+            self._wait(timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            return True
+        except Exception:
+            self.logger.debug("Timed out waiting for the page to load")
+            return False
+
+    def wait_for_count(self, by: By, value: str, minimum: int, timeout: float = 10) -> int:
+        """
+        Wait until at least `minimum` elements match a locator.
+        
+        Args:
+            by: Locator strategy
+            value: Locator value
+            minimum: Number of matches to wait for
+            timeout: Maximum wait time
+            
+        Returns:
+            Number of matching elements when the wait ended
+        """
+        def enough_matches(driver):
+            count = len(driver.find_elements(by, value))
+            return count if count >= minimum else False
+        
+        try:
+            return self._wait(timeout).until(enough_matches)
+        except Exception:
+            return len(self.driver.find_elements(by, value))
+
+    def first_match(
+        self,
+        css_selectors: List[str],
+        attr: str = "text",
+        timeout: float = 0
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Read a value from the first of several fallback selectors, in one script call per poll.
+        
+        Args:
+            css_selectors: CSS selectors in order of preference
+            attr: Attribute to read; 'text' reads the visible text
+            timeout: Maximum time to wait for any selector to yield a value
+            
+        Returns:
+            (index of the selector that matched, its value), or None if none did
+        """
+        found = []
+        
+        def any_value(driver):
+            found[:] = driver.execute_script(_FIRST_MATCH_JS, css_selectors, attr) or []
+            return bool(found)
+        
+        try:
+            self._wait(timeout).until(any_value)
+        except Exception:
+            pass
+        return (found[0], found[1]) if found else None
+
+    def probe_elements(
+        self,
+        locators: Dict[str, Tuple[str, str]],
+        timeout: float = 0,
+        wait_for: Optional[List[str]] = None
+    ) -> Dict[str, bool]:
+        """
+        Check which of several locators match, with one script call per poll.
+        
+        Unlike find_element, an absent element costs nothing: the wait ends as
+        soon as one of the awaited locators matches.
+        
+        Args:
+            locators: Name -> (By.CSS_SELECTOR or By.XPATH, value)
+            timeout: Maximum time to wait for an awaited locator to match
+            wait_for: Names of the locators that end the wait; all of them by default
+            
+        Returns:
+            Name -> whether the locator matched when the wait ended
+        """
+        last = {}
+        awaited = list(locators) if wait_for is None else wait_for
+        
+        def any_match(driver):
+            last.update(driver.execute_script(_PROBE_ELEMENTS_JS, locators))
+            return any(last.get(name) for name in awaited)
+        
+        try:
+            self._wait(timeout).until(any_match)
+        except Exception:
+            if not last:
+                last.update(self.driver.execute_script(_PROBE_ELEMENTS_JS, locators))
+        return {name: bool(last.get(name)) for name in locators}
+
+    def _wait_cdp(self, selector: str, timeout: float) -> Optional[bool]:
+        """
+        Wait for a CSS selector to match inside the browser, in a single CDP call.
+        
+        The page polls every 50 ms itself, so no WebDriver commands are sent while waiting.
+        
+        Args:
+            selector: CSS selector to wait for
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            True if the selector matched, False on timeout, None if CDP is not available
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return None
+        timeout_ms = int(timeout * 1000)
+        expression = (
+            "new Promise(resolve => {"
+            f"const selector = {orjson.dumps(selector).decode()};"
+            "if (document.querySelector(selector)) { resolve(true); return; }"
+            "const timer = setInterval(() => {"
+            "if (document.querySelector(selector)) { clearInterval(timer); resolve(true); }"
+            "}, 50);"
+            f"setTimeout(() => {{ clearInterval(timer); resolve(false); }}, {timeout_ms});"
+            "})"
+        )
+        try:
+            result = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": expression,
+                "awaitPromise": True,
+                "returnByValue": True,
+                "timeout": timeout_ms + 1000
+            })
+            return bool(result.get("result", {}).get("value"))
+        except Exception as e:
+            self.logger.debug(f"CDP wait failed, falling back to WebDriverWait: {e}")
+            return None
+
     def execute_script(self, script: str, *args):
         """
         Execute JavaScript in the browser.
@@ -443,4 +1132,6 @@ class BrowserDriver:
             except Exception as e:
                 self.logger.error(f"Error closing browser: {str(e)}")
             finally:
-                self.driver = None
\ No newline at end of file
+                self.driver = None
+                self._wait_cache.clear()
+                self._element_cache.clear()
\ No newline at end of file
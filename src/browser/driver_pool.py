@@ -0,0 +1,102 @@
+"""
+Driver Pool Module
+
+Keeps several warm browsers so independent pages can be scraped in parallel.
+Each browser is checked out by one thread at a time; WebDriver sessions are
+not safe to share between threads.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from src.browser.driver import BrowserDriver
+from src.config.config import Config
+from src.utils.logger import app_logger
+
+
+class DriverPool:
+    """
+    Fixed-size pool of BrowserDriver instances sharing one saved login session.
+    
+    Usage:
+        with pool.acquire() as browser:
+            browser.get(url)
+    """
+    
+    def __init__(
+        self,
+        size: int = Config.MAX_PARALLEL_DRIVERS,
+        docker_env: bool = False,
+        headless: bool = True,
+        cookie_file: Optional[Path] = None
+    ):
+        """
+        Start the pool's browsers, concurrently.
+        
+        Args:
+            size: Number of browsers (MAX_PARALLEL_DRIVERS by default)
+            docker_env: Whether to run in Docker environment
+            headless: Whether to run in headless mode
+            cookie_file: Saved session loaded into every browser, if given
+        """
+        self.size = max(1, size)
+        self.docker_env = docker_env
+        self.headless = headless
+        self.cookie_file = cookie_file
+        self.logger = app_logger
+        self._all: List[BrowserDriver] = []
+        self._idle: "queue.Queue[BrowserDriver]" = queue.Queue()
+        
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._start_browser) for _ in range(self.size)]
+        failures = [future.exception() for future in futures if future.exception()]
+        self._all = [future.result() for future in futures if not future.exception()]
+        if failures:
+            # Don't leave the browsers that did start running
+            self.close()
+            raise failures[0]
+        for browser in self._all:
+            self._idle.put(browser)
+        self.logger.info(f"Driver pool ready with {self.size} browsers")
+
+    def _start_browser(self) -> BrowserDriver:
+        """
+        Start one browser and restore the shared session into it.
+        
+        Returns:
+            BrowserDriver with a running WebDriver
+        """
+        browser = BrowserDriver(docker_env=self.docker_env, headless=self.headless)
+        browser.driver = browser.setup_driver()
+        if self.cookie_file:
+            browser.load_cookies(self.cookie_file)
+        return browser
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[BrowserDriver]:
+        """
+        Check out a browser for the duration of the block.
+        
+        Args:
+            timeout: Seconds to wait for a free browser (forever if None)
+            
+        Yields:
+            A BrowserDriver used by no other thread until the block exits
+        """
+        browser = self._idle.get(timeout=timeout)
+        try:
+            yield browser
+        finally:
+            self._idle.put(browser)
+
+    def close(self):
+        """Close every browser in the pool."""
+        for browser in self._all:
+            try:
+                browser.close()
+            except Exception as e:
+                self.logger.error(f"Error closing pooled browser: {str(e)}")
+        self._all.clear()
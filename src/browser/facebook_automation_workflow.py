@@ -6,15 +6,20 @@ It scrapes posts, analyzes linked articles, and posts intelligent comments based
 content analysis (clickbait detection and summarization).
 """
 
+import hashlib
 import threading
 import time
 import random
 import logging
+import multiprocessing
 import os
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Callable, ClassVar
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from dotenv import load_dotenv
+import orjson
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -27,19 +32,14 @@ from src.analyzer.text_analyzer import TextAnalyzer
 from src.poster.facebook_poster import FacebookPoster
 from db.facebook_database import FacebookDatabase
 from src.config.config import Config
+from src.utils.bloom_filter import BloomFilter
+from src.utils.rate_limiter import RateLimiter
 from src.utils.logger import app_logger
 
 # Load environment variables
 load_dotenv()
 
 
-class PostExtractionStrategy(Enum):
-    """Strategies for extracting article URLs from posts."""
-    POST_CARD = "post_card"
-    POST_TEXT = "post_text"
-    COMMENT_SECTION = "comment_section"
-
-
 @dataclass
 class PostData:
     """Data container for Facebook post information."""
@@ -50,43 +50,81 @@ class PostData:
     analysis: Optional[Dict[str, Any]] = None
     page_name: Optional[str] = None
     timestamp: Optional[float] = None
+    commented: bool = False
+    
+    def to_tuple(self) -> Tuple[Optional[str], str, Optional[str], int]:
+        """Return the post as a processed_posts row: (id, date, page, success)."""
+        date = datetime.fromtimestamp(self.timestamp or time.time()).strftime('%Y-%m-%d %H:%M:%S')
+        return (self.post_id, date, self.page_name, int(self.commented))
+
+
+def _env_flag(value: str) -> bool:
+    """Parse a 'true'/'false' environment value."""
+    return value.lower() == 'true'
 
 
+@dataclass(frozen=True)
 class FacebookConfig:
-    """Configuration manager for Facebook automation."""
-    
-    def __init__(self):
-        """Load configuration from environment variables."""
-        # Facebook credentials
-        self.fb_email = os.getenv('FB_EMAIL')
-        self.fb_password = os.getenv('FB_PASSWORD')
-        
-        # Pages to scrape
-        pages_str = os.getenv('FACEBOOK_PAGES', 'redgol,adncl')
-        self.facebook_pages = [p.strip() for p in pages_str.split(',')]
-        
-        # OpenRouter API
-        self.openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
-        self.openrouter_model = os.getenv('OPENROUTER_MODEL', 'gpt-3.5-turbo')
-        
-        # Automation settings
-        self.max_posts_per_page = int(os.getenv('MAX_POSTS_PER_PAGE', '5'))
-        self.run_interval_minutes = int(os.getenv('RUN_INTERVAL_MINUTES', '60'))
-        self.enable_comments = os.getenv('ENABLE_COMMENTS', 'true').lower() == 'true'
-        self.headless_mode = os.getenv('HEADLESS_MODE', 'false').lower() == 'true'
-        self.docker_env = os.getenv('DOCKER_ENV', 'false').lower() == 'true'
-        
-        # Delays and timeouts
-        self.min_delay_seconds = float(os.getenv('MIN_DELAY_SECONDS', '1'))
-        self.max_delay_seconds = float(os.getenv('MAX_DELAY_SECONDS', '3'))
-        self.page_load_timeout = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
-        
-        # Database settings
-        self.save_to_database = os.getenv('SAVE_TO_DATABASE', 'true').lower() == 'true'
-        
-        # Validate required settings
+    """Configuration for Facebook automation, parsed from the environment once per process."""
+    # Facebook credentials
+    fb_email: Optional[str]
+    fb_password: Optional[str]
+    
+    # Pages to scrape
+    facebook_pages: Tuple[str, ...]
+    
+    # OpenRouter API
+    openrouter_api_key: Optional[str]
+    openrouter_model: str
+    
+    # Automation settings
+    max_posts_per_page: int
+    run_interval_minutes: int
+    enable_comments: bool
+    headless_mode: bool
+    # Worker processes (one browser each) used to process pages in parallel; 1 = sequential
+    page_workers: int
+    docker_env: bool
+    
+    # Delays and timeouts
+    min_delay_seconds: float
+    max_delay_seconds: float
+    page_load_timeout: int
+    
+    # Database settings
+    save_to_database: bool
+    
+    def __post_init__(self):
+        """Validate required settings."""
         self._validate()
     
+    @classmethod
+    def from_env(cls) -> "FacebookConfig":
+        """Build the configuration from environment variables."""
+        # field -> (environment variable, type, default)
+        schema = {
+            "fb_email": ('FB_EMAIL', str, None),
+            "fb_password": ('FB_PASSWORD', str, None),
+            "facebook_pages": ('FACEBOOK_PAGES', lambda v: tuple(p.strip() for p in v.split(',')), 'redgol,adncl'),
+            "openrouter_api_key": ('OPENROUTER_API_KEY', str, None),
+            "openrouter_model": ('OPENROUTER_MODEL', str, 'gpt-3.5-turbo'),
+            "max_posts_per_page": ('MAX_POSTS_PER_PAGE', int, '5'),
+            "run_interval_minutes": ('RUN_INTERVAL_MINUTES', int, '60'),
+            "enable_comments": ('ENABLE_COMMENTS', _env_flag, 'true'),
+            "headless_mode": ('HEADLESS_MODE', _env_flag, 'false'),
+            "page_workers": ('PAGE_WORKERS', lambda v: max(1, int(v)), '1'),
+            "docker_env": ('DOCKER_ENV', _env_flag, 'false'),
+            "min_delay_seconds": ('MIN_DELAY_SECONDS', float, '1'),
+            "max_delay_seconds": ('MAX_DELAY_SECONDS', float, '3'),
+            "page_load_timeout": ('PAGE_LOAD_TIMEOUT', int, '30'),
+            "save_to_database": ('SAVE_TO_DATABASE', _env_flag, 'true'),
+        }
+        values = {}
+        for field, (env, cast, default) in schema.items():
+            value = os.getenv(env, default)
+            values[field] = cast(value) if value is not None else None
+        return cls(**values)
+    
     def _validate(self):
         """Validate required configuration."""
         if not self.fb_email or not self.fb_password:
@@ -99,6 +137,17 @@ class FacebookConfig:
             raise ValueError("FACEBOOK_PAGES must be set in .env file")
 
 
+@lru_cache(maxsize=None)
+def get_facebook_config() -> FacebookConfig:
+    """
+    Return the process-wide configuration, reading the environment on first use.
+    
+    Returns:
+        The shared, immutable FacebookConfig
+    """
+    return FacebookConfig.from_env()
+
+
 class FacebookAutomationWorkflow:
     """
     Orchestrates the complete Facebook automation workflow.
@@ -119,34 +168,70 @@ class FacebookAutomationWorkflow:
         article_scraper: ArticleScraper for article extraction
         db: FacebookDatabase for data persistence
     """
+    # Cached articles and analyses older than this are not reused
+    CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+    CACHE_PRELOAD_LIMIT = 10_000
+    # Smallest Bloom filter of processed post IDs; larger databases get twice their size
+    SEEN_IDS_MIN_CAPACITY = 10_000
     
-    def __init__(self, config: Optional[FacebookConfig] = None, shutdown_event: threading.Event = None):
+    def __init__(
+        self,
+        config: Optional[FacebookConfig] = None,
+        shutdown_event: threading.Event = None,
+        db: Optional[FacebookDatabase] = None,
+        analyzer: Optional[TextAnalyzer] = None
+    ):
         """
         Initialize the Facebook automation workflow.
         
         Args:
-            config: Optional FacebookConfig instance (creates new if None)
+            config: Optional FacebookConfig instance (uses the shared one if None)
+            shutdown_event: Event checked between steps to stop early
+            db: Optional shared FacebookDatabase; the workflow opens (and closes) its own if None
+            analyzer: Optional shared TextAnalyzer; the workflow creates (and closes) its own if None
         """
         self.logger = app_logger or logging.getLogger(__name__)
-        self.config = config or FacebookConfig()
-        self.shutdown_event = shutdown_event
+        self.config = config or get_facebook_config()
+        self.shutdown_event = shutdown_event or threading.Event()
+        # Spaces out page loads; page workers replace it with one shared by the whole pool
+        self._page_limiter = RateLimiter(Config.PAGE_INTERVAL_SECONDS)
         
-        # Initialize browser with config settings
-        self.browser = BrowserDriver(
-            docker_env=self.config.docker_env,
-            headless=self.config.headless_mode
-        )
-        # Set up the browser driver
-        self.browser.driver = self.browser.setup_driver()
+        # Reuse this process's browser when one is still alive; cold starts cost seconds
+        self.browser = _get_or_create_driver(self.config)
 
         self.logger.info("Is self.browser a NoneType? " + str(self.browser is None))
         
         # Initialize components
-        self.scraper = FacebookScraper(self.browser, is_testing=False)
-        self.analyzer = TextAnalyzer()
-        self.poster = FacebookPoster(self.browser)
         self.article_scraper = ArticleScraper()
-        self.db = FacebookDatabase() if self.config.save_to_database else None
+        self.scraper = FacebookScraper(self.browser, is_testing=False, article_scraper=self.article_scraper)
+        self._owns_analyzer = analyzer is None
+        self.analyzer = analyzer or TextAnalyzer()
+        self.poster = FacebookPoster(self.browser)
+        if Config.ARTICLE_HOSTS:
+            # Resolve and connect to the usual article sites while the browser logs in
+            threading.Thread(
+                target=self.article_scraper.warm_up,
+                args=(Config.ARTICLE_HOSTS,),
+                name="article-warmup",
+                daemon=True
+            ).start()
+        self._owns_db = db is None
+        if db is not None:
+            self.db = db
+        else:
+            self.db = FacebookDatabase() if self.config.save_to_database else None
+        
+        # Post IDs already handled, loaded once so known posts are skipped before any browser work
+        self._seen_ids = self._load_seen_ids()
+        # Post IDs collected by this workflow and not saved yet; the filter above can't confirm them
+        self._unsaved_ids: set = set()
+        # Post IDs read straight from the feed's links, by post element
+        self._post_id_hints: Dict[WebElement, str] = {}
+        
+        # Article texts by URL hash and analyses by input hash; backed by the database when enabled
+        self._article_cache: Dict[str, str] = {}
+        self._analysis_cache: Dict[str, Dict[str, Any]] = {}
+        self._load_caches()
         
         # Configuration
         self.max_scroll_attempts = 3
@@ -157,6 +242,25 @@ class FacebookAutomationWorkflow:
         self.scraper.username = self.config.fb_email
         self.scraper.password = self.config.fb_password
         
+    def _load_caches(self) -> None:
+        """Preload recently cached articles and analyses from the database."""
+        if not self.db:
+            return
+        self._article_cache.update(
+            self.db.recent_articles(self.CACHE_MAX_AGE_SECONDS, self.CACHE_PRELOAD_LIMIT)
+        )
+        for key, analysis_json in self.db.recent_analyses(
+            self.CACHE_MAX_AGE_SECONDS, self.CACHE_PRELOAD_LIMIT
+        ).items():
+            try:
+                self._analysis_cache[key] = orjson.loads(analysis_json)
+            except orjson.JSONDecodeError:
+                continue
+        self.logger.info(
+            f"Loaded {len(self._article_cache)} cached articles and "
+            f"{len(self._analysis_cache)} cached analyses"
+        )
+        
     def run_workflow(
         self, 
         page_names: Optional[List[str]] = None,
@@ -189,25 +293,41 @@ class FacebookAutomationWorkflow:
             if not self._login():
                 raise RuntimeError("Failed to login to Facebook")
             
-            # Step 2: Process each page
-            for page_name in page_names:
+            # Step 2: Process each page, in worker processes if configured
+            workers = min(self.config.page_workers, len(page_names), os.cpu_count() or 1)
+            if workers > 1:
+                results.extend(self._process_pages_in_pool(
+                    page_names,
+                    max_posts_per_page,
+                    comment_on_posts,
+                    workers
+                ))
+                return results
+            
+            # A page is analyzed in the background while the next one is read in the
+            # browser; its comments are posted (and its posts saved) after that
+            analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+            previous_page: Optional[Tuple[List[PostData], Future]] = None
+            try:
+                for page_name in page_names:
 
-                # Check for shutdown signal
-                if self.shutdown_event.is_set():
-                    self.logger.info("Shutdown requested - terminating page processing")
-                    return results
+                    # Check for shutdown signal
+                    if self.shutdown_event.is_set():
+                        self.logger.info("Shutdown requested - terminating page processing")
+                        return results
 
-                self.logger.info(f"Processing page: {page_name}")
-                page_results = self._process_page(
-                    page_name, 
-                    max_posts_per_page,
-                    comment_on_posts
-                )
-                results.extend(page_results)
-                
-                # Add delay between pages
-                if page_name != page_names[-1]:
-                    self._wait_random(5, 10)
+                    self.logger.info(f"Processing page: {page_name}")
+                    page_results = self._collect_page(page_name, max_posts_per_page)
+                    analysis = analysis_executor.submit(self.analyze_many, page_results)
+                    results.extend(page_results)
+                    
+                    if previous_page:
+                        self._finish_page(*previous_page, comment_on_posts)
+                    previous_page = (page_results, analysis)
+            finally:
+                if previous_page:
+                    self._finish_page(*previous_page, comment_on_posts)
+                analysis_executor.shutdown(wait=False, cancel_futures=True)
                 
         except Exception as e:
             self.logger.error(f"Workflow failed: {str(e)}")
@@ -215,6 +335,58 @@ class FacebookAutomationWorkflow:
             
         return results
     
+    def _process_pages_in_pool(
+        self,
+        page_names: List[str],
+        max_posts: int,
+        comment_on_posts: bool,
+        workers: int
+    ) -> List[PostData]:
+        """
+        Process pages in parallel worker processes, each with its own browser.
+        
+        Selenium drivers can't be shared between threads, so every worker
+        starts its own browser and reuses this session's login cookies.
+        
+        Args:
+            page_names: Names of the Facebook pages
+            max_posts: Maximum number of posts to process per page
+            comment_on_posts: Whether to comment on posts
+            workers: Number of worker processes
+            
+        Returns:
+            List of PostData objects from all pages, in completion order
+        """
+        cookies = self.browser.driver.get_cookies()
+        # Spawned rather than forked: this process already runs browser and HTTP threads
+        context = multiprocessing.get_context("spawn")
+        worker_shutdown = context.Event()
+        page_limiter = RateLimiter(Config.PAGE_INTERVAL_SECONDS, context)
+        tasks = [(page_name, max_posts, comment_on_posts, cookies) for page_name in page_names]
+        results = []
+        
+        self.logger.info(f"Processing {len(tasks)} pages with {workers} worker processes")
+        with context.Pool(
+            processes=workers,
+            initializer=_init_page_worker,
+            initargs=(worker_shutdown, page_limiter)
+        ) as pool:
+            pages = pool.imap_unordered(process_page_worker, tasks)
+            remaining = len(tasks)
+            while remaining:
+                # Relay a shutdown request to the workers
+                if self.shutdown_event.is_set() and not worker_shutdown.is_set():
+                    self.logger.info("Shutdown requested - stopping page workers")
+                    worker_shutdown.set()
+                try:
+                    page_results = pages.next(timeout=1)
+                except multiprocessing.TimeoutError:
+                    continue
+                remaining -= 1
+                results.extend(page_results)
+                
+        return results
+    
     def _login(self) -> bool:
         """
         Login to Facebook using credentials from config.
@@ -251,10 +423,30 @@ class FacebookAutomationWorkflow:
         Returns:
             List of PostData objects for processed posts
         """
+        results = self._collect_page(page_name, max_posts)
+        self._finish_page(results, None, comment_on_posts)
+        return results
+    
+    def _collect_page(self, page_name: str, max_posts: int) -> List[PostData]:
+        """
+        Read a page's posts and their linked articles; everything that needs the feed open.
+        
+        Args:
+            page_name: Name of the Facebook page
+            max_posts: Maximum number of posts to process
+            
+        Returns:
+            List of PostData objects, not yet analyzed
+        """
         results = []
+        # Article downloads started while the remaining posts are still being extracted
+        article_fetches: Dict[str, Future] = {}
         
         try:
-            # Navigate to page
+            # Navigate to page, no sooner than the page limiter allows
+            if not self._page_limiter.wait(self.shutdown_event):
+                self.logger.info("Shutdown requested - terminating page processing")
+                return results
             page_url = f"{Config.SOURCE_URL}{page_name}"
             self.browser.get(page_url)
             self._wait_random(
@@ -289,21 +481,18 @@ class FacebookAutomationWorkflow:
                     break
                     
                 self.logger.info(f"Processing post {i+1}/{len(posts)}")
-                post_data = self._process_single_post(
-                    post, 
-                    page_name,
-                    comment_on_posts
-                )
+                post_data = self._process_single_post(post, page_name)
                 
                 if post_data and post_data.post_id and post_data.post_id not in processed_ids:
                     post_data.timestamp = time.time()
                     results.append(post_data)
                     processed_ids.add(post_data.post_id)
+                    self._unsaved_ids.add(post_data.post_id)
                     processed_count += 1
                     
-                    # Save to database
-                    if self.config.save_to_database and self.db:
-                        self._save_to_database(post_data)
+                    # Download the article in the background during the delays below
+                    if post_data.article_url:
+                        self._prefetch_article(article_fetches, post_data.article_url)
                     
                     # Add delay between posts
                     self._wait_random(
@@ -312,12 +501,54 @@ class FacebookAutomationWorkflow:
                     )
                 else:
                     self.logger.info("Skipping duplicate or invalid post")
+
+            # Fetch the linked articles of all collected posts together
+            self._scrape_articles(results, article_fetches)
                         
         except Exception as e:
             self.logger.error(f"Error processing page {page_name}: {str(e)}")
             
+        finally:
+            # Don't leave downloads queued for a page that was abandoned
+            for future in article_fetches.values():
+                future.cancel()
+            
         return results
     
+    def _finish_page(
+        self,
+        posts: List[PostData],
+        analysis: Optional[Future],
+        comment_on_posts: bool
+    ) -> None:
+        """
+        Analyze a collected page, comment on its posts and save them.
+        
+        Args:
+            posts: PostData objects returned by _collect_page
+            analysis: Future of an analyze_many call already running for these
+                posts, or None to analyze them now
+            comment_on_posts: Whether to comment on posts
+        """
+        try:
+            # Analyze every collected post in as few requests as possible
+            if analysis is not None:
+                analysis.result()
+            else:
+                self.analyze_many(posts)
+
+            # Comment on the analyzed posts
+            if comment_on_posts:
+                self._comment_on_posts(posts)
+                
+        except Exception as e:
+            self.logger.error(f"Error finishing page: {str(e)}")
+            
+        finally:
+            # Persist everything collected on this page in one transaction
+            if self.config.save_to_database and self.db:
+                self._save_to_database(posts)
+    
     def _load_initial_posts(self) -> List[WebElement]:
         """
         Load initial posts from the current page.
@@ -348,21 +579,85 @@ class FacebookAutomationWorkflow:
         else:
             self.logger.warning(f"No posts loaded after {self.max_initial_post_attempts} attempts")
             
+        self._post_id_hints = self._read_post_id_hints(posts)
         return posts
     
+    def _read_post_id_hints(self, posts: List[WebElement]) -> Dict[WebElement, str]:
+        """
+        Read post IDs from links already present in the feed, in one script call.
+        
+        Facebook often only reveals a post's link on hover, so this finds IDs for
+        some posts only; the rest go through the hover-based extraction.
+        
+        Args:
+            posts: Post elements from the feed
+            
+        Returns:
+            Mapping of post element to post ID for the posts whose ID was found
+        """
+        if not posts:
+            return {}
+        try:
+            hrefs = self.browser.execute_script(
+                "return arguments[0].map(p => {"
+                "const a = p.querySelector('a[href*=\"/posts/\"]');"
+                "return a ? a.href : null;"
+                "});",
+                posts
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to read post ID hints: {str(e)}")
+            return {}
+        
+        hints = {}
+        for post, href in zip(posts, hrefs):
+            post_id = self.scraper.url_utils.extract_post_id(href) if href else None
+            if post_id:
+                hints[post] = post_id
+        self.logger.info(f"Found post IDs for {len(hints)}/{len(posts)} posts without hovering")
+        return hints
+    
+    def _load_seen_ids(self) -> BloomFilter:
+        """
+        Load the IDs of every processed post into a Bloom filter.
+        
+        Returns:
+            BloomFilter sized for the stored posts plus room to grow
+        """
+        if not self.db:
+            return BloomFilter(self.SEEN_IDS_MIN_CAPACITY)
+        seen_ids = BloomFilter(max(self.db.post_count() * 2, self.SEEN_IDS_MIN_CAPACITY))
+        seen_ids.update(self.db.all_post_ids())
+        return seen_ids
+    
+    def _is_known_post(self, post_id: str) -> bool:
+        """
+        Check whether a post was already processed.
+        
+        The Bloom filter rules out new posts without touching the database;
+        its rare false positives are confirmed against the database.
+        
+        Args:
+            post_id: Facebook post ID
+            
+        Returns:
+            True if the post was processed before
+        """
+        if post_id in self._unsaved_ids:
+            return True
+        return post_id in self._seen_ids and bool(self.db and self.db.post_exists(post_id))
+    
     def _process_single_post(
         self,
         post_element: WebElement,
-        page_name: str,
-        comment_on_post: bool
+        page_name: str
     ) -> Optional[PostData]:
         """
-        Process a single Facebook post.
+        Extract a single Facebook post and its linked article.
         
         Args:
             post_element: WebElement of the post
             page_name: Name of the Facebook page
-            comment_on_post: Whether to comment on this post
             
         Returns:
             PostData object with extracted information, or None if failed
@@ -370,13 +665,19 @@ class FacebookAutomationWorkflow:
         post_data = PostData(page_name=page_name)
         
         try:
+            # Skip known posts before the scroll-and-hover extraction
+            hinted_id = self._post_id_hints.get(post_element)
+            if hinted_id and self._is_known_post(hinted_id):
+                self.logger.info(f"Post {hinted_id} already processed; skipping")
+                return None
+            
             # Extract post ID
-            post_data.post_id = self._extract_post_id(post_element)
+            post_data.post_id = hinted_id or self._extract_post_id(post_element)
             if not post_data.post_id:
                 self.logger.warning("Failed to extract post ID")
                 return None
             else:
-                if self.db and self.db.post_exists(post_data.post_id):
+                if self._is_known_post(post_data.post_id):
                     self.logger.info(f"Post {post_data.post_id} already processed; skipping")
                     return None
                             
@@ -388,20 +689,6 @@ class FacebookAutomationWorkflow:
             # Extract post content
             post_data.post_text, post_data.article_url = self._extract_post_content()
             
-            # Process article if URL found
-            if post_data.article_url:
-                post_data.article_text = self._scrape_article(post_data.article_url)
-                
-                if post_data.article_text and post_data.post_text:
-                    post_data.analysis = self._analyze_content(
-                        post_data.post_text,
-                        post_data.article_text
-                    )
-                    
-                    # Post comment if enabled and analysis successful
-                    if comment_on_post and post_data.analysis and post_data.analysis.get('output'):
-                        self._post_comment(post_data.analysis['output'])
-            
             # Close post tab
             self.browser.close_current_tab()
             
@@ -419,6 +706,8 @@ class FacebookAutomationWorkflow:
         """
         Extract the post ID from a post element.
         
+        Tries a single in-page script first and falls back to a real mouse hover.
+        
         Args:
             post_element: WebElement of the post
             
@@ -426,30 +715,36 @@ class FacebookAutomationWorkflow:
             Post ID string or None if extraction failed
         """
         try:
-            # Scroll to post and make it visible
-            self.browser.scroll_to_element(post_element)
-            
-            # Find the link element that contains post ID
-            link_element = post_element.find_element(
-                By.CSS_SELECTOR, 
-                self.scraper.CSS_SELECTOR_POST_ID_ELEMENT
+            post_link = self.browser.extract_post_link_js(
+                post_element,
+                self.scraper.CSS_SELECTOR_POST_ID_ON_HOVER
             )
+            post_id = self.scraper.url_utils.extract_post_id(post_link) if post_link else None
+            if post_id:
+                self.logger.info(f"Extracted post ID: {post_id}")
+                return post_id
+        except Exception as e:
+            self.logger.debug(f"Scripted post link extraction failed: {str(e)}")
             
-            # Hover to reveal the actual post link
-            self.browser.scroll_to_element(link_element)
-            self.browser.scroll(times=3)
-            self.browser.hover_element(link_element)
-            self._wait_random(0.5, 1.5)
+        return self._extract_post_id_by_hover(post_element)
+    
+    def _extract_post_id_by_hover(self, post_element: WebElement) -> Optional[str]:
+        """
+        Extract the post ID by scrolling to the post and hovering its link.
+        
+        Args:
+            post_element: WebElement of the post
             
-            # Extract the post link
-            post_link_element = post_element.find_element(
+        Returns:
+            Post ID string or None if extraction failed
+        """
+        try:
+            # Find the link once and let the scraper hover it; it scrolls to the link itself
+            link_element = post_element.find_element(
                 By.CSS_SELECTOR,
-                self.scraper.CSS_SELECTOR_POST_ID_ON_HOVER
+                self.scraper.CSS_SELECTOR_POST_ID_ELEMENT
             )
-            post_link = post_link_element.get_attribute("href")
-            
-            # Extract ID from URL
-            post_id = self.scraper.url_utils.extract_post_id(post_link)
+            post_id = self.scraper.extract_post_id(post_element, link_element)
             
             if post_id:
                 self.logger.info(f"Extracted post ID: {post_id}")
@@ -524,10 +819,11 @@ class FacebookAutomationWorkflow:
             Extracted text or None
         """
         try:
-            text_boxes = post_box.find_elements(
-                By.CSS_SELECTOR,
-                "div[data-ad-comet-preview='message']"
-            )
+            with self.browser.implicit_wait(3):
+                text_boxes = post_box.find_elements(
+                    By.CSS_SELECTOR,
+                    "div[data-ad-comet-preview='message']"
+                )
             
             # Use overlay box if multiple elements found
             if len(text_boxes) > 1:
@@ -539,17 +835,15 @@ class FacebookAutomationWorkflow:
                 self.logger.warning("No text box found")
                 return None
             
-            # Extract text from divs
-            text_divs = text_box.find_elements(
-                By.CSS_SELECTOR,
-                "div.html-div > div > div[dir='auto']"
+            # Extract and join the text of all divs in one round trip
+            post_texts = self.browser.query_text_join(
+                text_box,
+                "div.html-div > div > div[dir='auto']",
+                "\n"
             )
             
-            post_texts = "\n".join([
-                d.text.strip() for d in text_divs if d.text.strip()
-            ])
-            
-            self.logger.info(f"Extracted post text: {post_texts[:100]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Extracted post text: {post_texts[:100]}...")
             return post_texts
             
         except Exception as e:
@@ -571,21 +865,15 @@ class FacebookAutomationWorkflow:
         Returns:
             Article URL or None
         """
-        strategies = [
-            (PostExtractionStrategy.POST_CARD, self._extract_url_from_card),
-            (PostExtractionStrategy.POST_TEXT, self._extract_url_from_text),
-            (PostExtractionStrategy.COMMENT_SECTION, self._extract_url_from_comments)
-        ]
-        
-        for strategy, method in strategies:
+        for strategy, method in self._STRATEGIES:
             try:
-                self.logger.info(f"Trying {strategy.value} extraction...")
-                url = method(post_box, post_text)
+                self.logger.info(f"Trying {strategy} extraction...")
+                url = method(self, post_box, post_text)
                 if url:
-                    self.logger.info(f"Found URL via {strategy.value}: {url}")
+                    self.logger.info(f"Found URL via {strategy}: {url}")
                     return url
             except Exception as e:
-                self.logger.debug(f"{strategy.value} extraction failed: {str(e)}")
+                self.logger.debug(f"{strategy} extraction failed: {str(e)}")
                 
         self.logger.warning("No article URL found with any strategy")
         return None
@@ -614,6 +902,16 @@ class FacebookAutomationWorkflow:
         
         return article_link.get_attribute("href")
     
+    def _extract_link_from_text(
+        self,
+        post_box: WebElement,
+        post_text: Optional[str]
+    ) -> Optional[str]:
+        """Extract an explicit http(s) link from post text content; cheap, so it runs first."""
+        if post_text:
+            return self.scraper.url_utils.extract_http_url(post_text)
+        return None
+    
     def _extract_url_from_text(
         self,
         post_box: WebElement,
@@ -635,25 +933,132 @@ class FacebookAutomationWorkflow:
             "a[attributionsrc][rel='nofollow noreferrer'][role='link'][tabindex='0'][target='_blank']"
         )
         
-        # Filter out links with aria attributes
-        filtered_links = [
-            link for link in article_links
-            if link.get_attribute("aria-labelledby") is None
-            and link.get_attribute("aria-label") is None
-        ]
-        
-        # Return first valid link
-        for link in filtered_links:
-            href = link.get_attribute("href")
-            text = link.text.strip()
-            if href and text:
-                return href
+        # Read every link's attributes in one round trip
+        links = self.browser.element_attrs(
+            article_links,
+            ["aria-labelledby", "aria-label", "href", "text"]
+        )
+        
+        # Return first valid link, skipping ones with aria attributes
+        for link in links:
+            if link["aria-labelledby"] is not None or link["aria-label"] is not None:
+                continue
+            if link["href"] and (link["text"] or "").strip():
+                return link["href"]
                 
         return None
     
-    def _scrape_article(self, article_url: str) -> Optional[str]:
+    # Article URL extraction strategies, tried in order by _extract_article_url
+    _STRATEGIES: ClassVar[Tuple[Tuple[str, Callable[..., Optional[str]]], ...]] = (
+        ("post_text_link", _extract_link_from_text),
+        ("post_card", _extract_url_from_card),
+        ("post_text", _extract_url_from_text),
+        ("comment_section", _extract_url_from_comments),
+    )
+    
+    def _prefetch_article(self, fetches: Dict[str, Future], article_url: str) -> None:
+        """
+        Start downloading an article over HTTP unless it is cached or already queued.
+        
+        Args:
+            fetches: Pending downloads by URL key; updated in place
+            article_url: URL of the article
+        """
+        url, url_key = self._article_key(article_url)
+        if url_key not in self._article_cache and url_key not in fetches:
+            fetches[url_key] = self.article_scraper.submit(url)
+    
+    def _scrape_articles(
+        self,
+        posts: List[PostData],
+        fetches: Optional[Dict[str, Future]] = None
+    ) -> None:
+        """
+        Fetch the linked articles of a page's posts in one pass.
+        
+        Cached articles are reused, the rest are downloaded concurrently over
+        HTTP, and only the ones that need a browser are opened in a tab.
+        
+        Args:
+            posts: PostData objects; their article_text field is filled in place
+            fetches: Downloads already started with _prefetch_article, by URL key
+        """
+        waiting: Dict[str, List[PostData]] = {}
+        urls: Dict[str, str] = {}
+        for post_data in posts:
+            if not post_data.article_url or post_data.article_text:
+                continue
+            url, url_key = self._article_key(post_data.article_url)
+            cached = self._article_cache.get(url_key)
+            if cached:
+                self.logger.info(f"Using cached article text for {url}")
+                post_data.article_text = cached
+                continue
+            waiting.setdefault(url_key, []).append(post_data)
+            urls[url_key] = url
+        if not urls:
+            return
+        
+        fetches = fetches if fetches is not None else {}
+        missing = [url_key for url_key in urls if url_key not in fetches]
+        if missing:
+            self.logger.info(f"Fetching {len(missing)} articles over HTTP...")
+            for url_key in missing:
+                fetches[url_key] = self.article_scraper.submit(urls[url_key])
+        
+        for url_key, url_posts in waiting.items():
+            
+            # Check for shutdown signal
+            if self.shutdown_event.is_set():
+                self.logger.info("Shutdown requested - skipping remaining articles")
+                return
+                
+            try:
+                article_text = fetches[url_key].result()
+            except Exception as e:
+                self.logger.error(f"Failed to fetch article {urls[url_key]}: {str(e)}")
+                article_text = None
+            if article_text:
+                self.logger.info(f"Scraped article text over HTTP: {len(article_text)} characters")
+            else:
+                article_text = self._scrape_article_in_browser(url_posts[0].article_url)
+            self._remember_article(url_key, urls[url_key], article_text)
+            for post_data in url_posts:
+                post_data.article_text = article_text
+    
+    def _article_key(self, article_url: str) -> Tuple[str, str]:
+        """
+        Canonicalize an article URL and derive its cache key.
+        
+        Args:
+            article_url: URL of the article as found in the post
+            
+        Returns:
+            Tuple of (canonical URL, SHA-1 hex digest of it)
+        """
+        url = self.scraper.url_utils.canonicalize_url(article_url)
+        return url, hashlib.sha1(url.encode()).hexdigest()
+    
+    def _remember_article(self, url_key: str, url: str, article_text: Optional[str]) -> None:
+        """
+        Cache a scraped article in memory and in the database, unless scraping failed.
+        
+        Args:
+            url_key: Cache key from _article_key
+            url: Canonical URL of the article
+            article_text: Scraped text, or None / an error message on failure
+        """
+        if not article_text or article_text.startswith(ArticleScraper.ERROR_PREFIX):
+            return
+        self._article_cache[url_key] = article_text
+        if self.db:
+            self.db.cache_article(url_key, url, article_text)
+    
+    def _scrape_article_in_browser(self, article_url: str) -> Optional[str]:
         """
-        Scrape article content from URL.
+        Scrape an article by opening it in a new browser tab.
+        
+        Used when plain HTTP yields no text, e.g. for pages rendered by JavaScript.
         
         Args:
             article_url: URL of the article
@@ -662,13 +1067,12 @@ class FacebookAutomationWorkflow:
             Article text or None
         """
         try:
-            self.logger.info(f"Scraping article: {article_url}")
+            self.logger.info(f"HTTP scrape returned no text; opening {article_url} in the browser")
             self.browser.open_new_tab(article_url)
             self._wait_random(2, 3)
             
-            article_text = self.article_scraper.scrape_article(
-                self.browser.driver.current_url
-            )
+            # Parse the DOM the browser rendered; fetching the URL again would get the same empty page
+            article_text = self.article_scraper.parse_html(self.browser.driver.page_source) or None
             
             # Close article tab
             self.browser.close_current_tab()
@@ -686,33 +1090,127 @@ class FacebookAutomationWorkflow:
                 pass
             return None
     
-    def _analyze_content(
-        self,
-        post_text: str,
-        article_text: str
-    ) -> Optional[Dict[str, Any]]:
+    def analyze_many(self, posts: List[PostData]) -> None:
         """
-        Analyze post and article content.
+        Analyze all posts that have both post and article text.
+        
+        Posts are grouped into batches of the analyzer's batch size and the
+        batched requests run concurrently on a thread pool.
+        
+        Args:
+            posts: PostData objects to analyze; their analysis field is filled in place
+        """
+        pending = []
+        keys = {}
+        for post_data in posts:
+            if not (post_data.post_text and post_data.article_text):
+                continue
+            key = self._analysis_key(post_data.post_text, post_data.article_text)
+            cached = self._analysis_cache.get(key)
+            if cached:
+                # Same article and post text as before; no need to ask the model again
+                post_data.analysis = dict(cached)
+                self.logger.info(f"Using cached analysis for {post_data.post_id}")
+            else:
+                keys[id(post_data)] = key
+                pending.append(post_data)
+        if not pending:
+            return
+            
+        batch_size = self.analyzer.batch_size
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        self.logger.info(f"Analyzing content of {len(pending)} posts in {len(chunks)} requests...")
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(Config.ANALYZE_CONCURRENCY, len(chunks)))) as executor:
+            futures = {
+                executor.submit(
+                    self.analyzer.analyze_batch,
+                    [(p.post_text, p.article_text) for p in chunk],
+                    self.shutdown_event
+                ): chunk
+                for chunk in chunks
+            }
+            
+            for future in as_completed(futures):
+                
+                # Check for shutdown signal
+                if self.shutdown_event.is_set():
+                    self.logger.info("Shutdown requested - cancelling pending analyses")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+                    
+                try:
+                    analyses = future.result()
+                except Exception as e:
+                    self.logger.error(f"Analysis failed: {str(e)}")
+                    continue
+                    
+                for post_data, analysis in zip(futures[future], analyses):
+                    post_data.analysis = analysis
+                    if analysis and analysis.get('output'):
+                        self.logger.info(f"Analysis complete for {post_data.post_id}: {analysis['output'][:100]}...")
+                        self._remember_analysis(keys[id(post_data)], analysis)
+    
+    @staticmethod
+    def _analysis_key(post_text: str, article_text: str) -> str:
+        """
+        Build the cache key of an analysis from its inputs.
         
         Args:
             post_text: Facebook post text
-            article_text: Article content
+            article_text: Article content; only its start is hashed
             
         Returns:
-            Analysis results dictionary or None
+            Hex digest pair identifying the inputs
         """
-        try:
-            self.logger.info("Analyzing content...")
-            analysis = self.analyzer.analyze(post_text, article_text)
-            
-            if analysis and analysis.get('output'):
-                self.logger.info(f"Analysis complete: {analysis['output'][:100]}...")
-            
-            return analysis
+        article_hash = hashlib.sha1(article_text[:4096].encode()).hexdigest()
+        post_hash = hashlib.sha1(post_text.encode()).hexdigest()
+        return f"{article_hash}:{post_hash}"
+    
+    def _remember_analysis(self, key: str, analysis: Dict[str, Any]) -> None:
+        """
+        Cache a completed analysis in memory and in the database.
+        
+        Args:
+            key: Cache key from _analysis_key
+            analysis: Analysis result to cache
+        """
+        self._analysis_cache[key] = dict(analysis)
+        if self.db:
+            self.db.cache_analysis(key, orjson.dumps(analysis).decode())
+    
+    def _comment_on_posts(self, posts: List[PostData]) -> None:
+        """
+        Reopen each analyzed post and post its analysis as a comment.
+        
+        Args:
+            posts: PostData objects previously analyzed
+        """
+        for post_data in posts:
             
-        except Exception as e:
-            self.logger.error(f"Analysis failed: {str(e)}")
-            return None
+            # Check for shutdown signal
+            if self.shutdown_event.is_set():
+                self.logger.info("Shutdown requested - terminating commenting")
+                return
+                
+            if not (post_data.analysis and post_data.analysis.get('output')):
+                continue
+                
+            if not self._open_post_in_new_tab(post_data.page_name, post_data.post_id):
+                self.logger.warning(f"Failed to reopen post {post_data.post_id} for commenting")
+                continue
+                
+            try:
+                # Wait for dialog to load
+                self._wait_random(2, 3)
+                post_data.commented = self._post_comment(post_data.analysis['output'])
+            finally:
+                self.browser.close_current_tab()
+                
+            self._wait_random(
+                self.config.min_delay_seconds,
+                self.config.max_delay_seconds
+            )
     
     def _post_comment(self, comment_text: str) -> bool:
         """
@@ -733,10 +1231,11 @@ class FacebookAutomationWorkflow:
                 'div[aria-labelledby][role="dialog"]'
             )
             
-            comment_box = post_box.find_element(
-                By.CSS_SELECTOR,
-                self.poster.CSS_SELECTOR_COMMENT_BOX
-            )
+            with self.browser.implicit_wait(Config.TIMEOUT):
+                comment_box = post_box.find_element(
+                    By.CSS_SELECTOR,
+                    self.poster.CSS_SELECTOR_COMMENT_BOX
+                )
             
             # Scroll to comment box and activate it
             self.browser.scroll_to_element(comment_box)
@@ -745,8 +1244,8 @@ class FacebookAutomationWorkflow:
             comment_box.click()
             self._wait_random(0.5, 1.5)
             
-            # Type comment with human-like delay
-            self.browser.type_with_delay(comment_box, comment_text)
+            # Insert the whole comment in one step and submit it
+            self.browser.paste_comment(comment_box, comment_text)
             self._wait_random(0.5, 1.5)
             
             self.logger.info("Comment posted successfully")
@@ -756,18 +1255,20 @@ class FacebookAutomationWorkflow:
             self.logger.error(f"Failed to post comment: {str(e)}")
             return False
     
-    def _save_to_database(self, post_data: PostData) -> None:
+    def _save_to_database(self, posts: List[PostData]) -> None:
         """
-        Save post data to database.
+        Save a page's posts to the database in a single batch.
         
         Args:
-            post_data: PostData object to save
+            posts: PostData objects to save
         """
         try:
-            if self.db:
-                self.logger.info(f"Saving post {post_data.post_id} to database")
-                # Implementation depends on database schema
-                # self.db.save_post(post_data)
+            if self.db and posts:
+                self.logger.info(f"Saving {len(posts)} posts to database")
+                if self.db.insert_posts([p.to_tuple() for p in posts]):
+                    for p in posts:
+                        self._seen_ids.add(p.post_id)
+                        self._unsaved_ids.discard(p.post_id)
         except Exception as e:
             self.logger.error(f"Failed to save to database: {str(e)}")
     
@@ -775,15 +1276,171 @@ class FacebookAutomationWorkflow:
         """
         Wait for a random time between min and max seconds.
         
+        Background work (e.g. article downloads) keeps running meanwhile, and
+        the wait ends early when a shutdown is requested.
+        
         Args:
             min_seconds: Minimum wait time
             max_seconds: Maximum wait time
         """
-        time.sleep(random.uniform(min_seconds, max_seconds))
+        self.shutdown_event.wait(random.uniform(min_seconds, max_seconds))
     
-    def close(self) -> None:
-        """Clean up resources and close browser."""
+    def is_healthy(self) -> bool:
+        """
+        Check that the browser session is still usable.
+        
+        Returns:
+            True if the WebDriver answers a trivial script, False otherwise
+        """
+        if not self.browser.driver:
+            return False
+        try:
+            return self.browser.execute_script("return 1;") == 1
+        except Exception as e:
+            self.logger.warning(f"Browser health check failed: {str(e)}")
+            return False
+    
+    def reset_tab_state(self) -> None:
+        """
+        Bring the browser back to a clean state between runs.
+        
+        Closes any tabs left open by a previous run and blanks the main tab.
+        Cookies are kept so the Facebook session survives across runs.
+        """
+        self.browser.close_all_other_tabs()
+        self.browser.driver.get("about:blank")
+    
+    def close(self, force_close: bool = False) -> None:
+        """
+        Clean up resources and release the browser.
+        
+        Args:
+            force_close: Quit the browser instead of parking it at about:blank
+                for the next workflow in this process
+        """
         try:
-            self.browser.close()
+            self.article_scraper.close()
         except Exception as e:
-            self.logger.error(f"Error closing browser: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"Error closing article scraper: {str(e)}")
+        if self._owns_analyzer:
+            try:
+                self.analyzer.close()
+            except Exception as e:
+                self.logger.error(f"Error closing analyzer session: {str(e)}")
+        _release_driver(self.browser, force_close)
+        if self.db and self._owns_db:
+            try:
+                self.db.close()
+            except Exception as e:
+                self.logger.error(f"Error closing database: {str(e)}")
+
+
+# Browser shared by every workflow in this process, with the settings it was started with
+_driver_singleton: Optional[BrowserDriver] = None
+_driver_settings: Optional[Tuple[bool, bool]] = None
+_driver_lock = threading.Lock()
+
+
+def _get_or_create_driver(config: FacebookConfig) -> BrowserDriver:
+    """
+    Return the process-wide browser, starting a new one if needed.
+    
+    The shared browser is reused when it was started with the same docker and
+    headless settings and still answers; otherwise it is quit and replaced.
+    
+    Args:
+        config: FacebookConfig with the browser settings
+        
+    Returns:
+        BrowserDriver with a running WebDriver
+    """
+    global _driver_singleton, _driver_settings
+    settings = (config.docker_env, config.headless_mode)
+    with _driver_lock:
+        browser = _driver_singleton
+        if browser is not None and browser.driver and _driver_settings == settings:
+            try:
+                if browser.execute_script("return 1;") == 1:
+                    app_logger.info("Reusing the running browser")
+                    return browser
+            except Exception as e:
+                app_logger.warning(f"Shared browser is unresponsive: {str(e)}")
+        if browser is not None:
+            browser.close()
+        
+        browser = BrowserDriver(docker_env=config.docker_env, headless=config.headless_mode)
+        browser.driver = browser.setup_driver()
+        _driver_singleton, _driver_settings = browser, settings
+        return browser
+
+
+def _release_driver(browser: BrowserDriver, force_close: bool = False) -> None:
+    """
+    Hand a workflow's browser back: park it at about:blank, or quit it.
+    
+    Args:
+        browser: BrowserDriver used by the workflow
+        force_close: Quit the browser (and forget it if it is the shared one)
+    """
+    global _driver_singleton, _driver_settings
+    with _driver_lock:
+        if not force_close and browser is _driver_singleton and browser.driver:
+            try:
+                browser.close_all_other_tabs()
+                browser.driver.get("about:blank")
+                return
+            except Exception as e:
+                app_logger.warning(f"Failed to park browser, closing it: {str(e)}")
+        if browser is _driver_singleton:
+            _driver_singleton, _driver_settings = None, None
+        try:
+            browser.close()
+        except Exception as e:
+            app_logger.error(f"Error closing browser: {str(e)}")
+
+
+# Shutdown event of the pool that owns this worker process
+_worker_shutdown_event = None
+# Page load limiter shared by all workers of that pool
+_worker_page_limiter: Optional[RateLimiter] = None
+
+
+def _init_page_worker(shutdown_event, page_limiter: RateLimiter) -> None:
+    """Pool initializer: keep the pool's shutdown event and page limiter for this worker process."""
+    global _worker_shutdown_event, _worker_page_limiter
+    _worker_shutdown_event = shutdown_event
+    _worker_page_limiter = page_limiter
+
+
+def process_page_worker(task: Tuple[str, int, bool, List[Dict[str, Any]]]) -> List[PostData]:
+    """
+    Process one Facebook page in a worker process.
+    
+    Starts a headless browser, restores the parent's login cookies and runs
+    the usual page processing (extraction, analysis, comments, saving).
+    
+    Args:
+        task: (page_name, max_posts, comment_on_posts, cookies) tuple
+        
+    Returns:
+        List of PostData objects for the page; empty on failure
+    """
+    page_name, max_posts, comment_on_posts, cookies = task
+    workflow = None
+    try:
+        config = replace(get_facebook_config(), headless_mode=True)
+        workflow = FacebookAutomationWorkflow(config, _worker_shutdown_event)
+        workflow._page_limiter = _worker_page_limiter
+        
+        # Reuse the parent's session instead of logging in again
+        workflow.browser.get(Config.SOURCE_URL)
+        workflow.browser.add_cookies(cookies)
+        
+        return workflow._process_page(page_name, max_posts, comment_on_posts)
+    except Exception as e:
+        app_logger.error(f"Page worker failed on {page_name}: {str(e)}")
+        return []
+    finally:
+        if workflow:
+            # The worker process may exit without running cleanup, so don't leave a browser behind
+            workflow.close(force_close=True)
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 from typing import List
 
@@ -14,11 +15,22 @@ class Config:
     OPENROUTER_MODEL: str = os.getenv("OPENROUTER_MODEL", "deepseek/deepseek-chat-v3-0324:free")
     SOURCE_URL: str = "https://www.facebook.com/"
     COOKIE_DIR: Path = Path(__file__).parent.parent.parent / "database" / "cookies"
+    COOKIE_MAX_AGE: int = 7 * 24 * 3600  # Seconds before a saved session is replaced by a fresh login
     DB_PATH: Path = Path(__file__).parent.parent.parent / "database" / "data.db"
     TIMEOUT: int = 10
     HTTP_TIMEOUT: int = 30
     MAX_SCROLLS: int = 5
     POST_LIMIT: int = 10
+    ANALYZE_BATCH_SIZE: int = int(os.getenv("ANALYZE_BATCH_SIZE", "8"))
+    ANALYZE_CONCURRENCY: int = int(os.getenv("ANALYZE_CONCURRENCY", "4"))
+    MAX_PARALLEL_DRIVERS: int = int(os.getenv("MAX_PARALLEL_DRIVERS", "2"))
+    ARTICLE_CONCURRENCY: int = int(os.getenv("ARTICLE_CONCURRENCY", "4"))
+    # Minimum time between two Facebook page loads, shared by all page workers
+    PAGE_INTERVAL_SECONDS: float = float(os.getenv("PAGE_INTERVAL_SECONDS", "5"))
+    # Don't download images, fonts, media or stylesheets; the scraper only reads text
+    SCRAPE_LIGHT: bool = os.getenv("SCRAPE_LIGHT", "true").lower() == "true"
+    # News sites linked by the monitored pages; connections to them are opened at startup
+    ARTICLE_HOSTS: List[str] = [h.strip() for h in os.getenv("ARTICLE_HOSTS", "").split(",") if h.strip()]
 
     @staticmethod
     def validate():
@@ -26,4 +38,40 @@ class Config:
         required = ["FB_EMAIL", "FB_PASSWORD", "FB_PAGES", "OPENROUTER_API_KEY"]
         missing = [key for key in required if not getattr(Config, key, None)]
         if missing:
-            raise ValueError(f"Missing environment variables: {missing}")
\ No newline at end of file
+            raise ValueError(f"Missing environment variables: {missing}")
+
+
+@dataclass(frozen=True)
+class AppSettings:
+    """Application runner settings, parsed from the environment once at startup."""
+    __slots__ = (
+        "run_mode", "run_interval_minutes", "max_retries", "retry_delay_seconds",
+        "max_backoff_seconds", "daily_post_limit", "daily_comment_limit", "error_log_cap"
+    )
+    run_mode: str  # 'single' or 'scheduled'
+    run_interval_minutes: int
+    max_retries: int
+    retry_delay_seconds: int
+    max_backoff_seconds: int
+    daily_post_limit: int
+    daily_comment_limit: int
+    error_log_cap: int
+
+    @classmethod
+    def from_env(cls) -> "AppSettings":
+        """Build the settings from environment variables."""
+        # field -> (environment variable, type, default)
+        schema = {
+            "run_mode": ("RUN_MODE", str, "scheduled"),
+            "run_interval_minutes": ("RUN_INTERVAL_MINUTES", int, "60"),
+            "max_retries": ("MAX_RETRIES", int, "3"),
+            "retry_delay_seconds": ("RETRY_DELAY_SECONDS", int, "300"),
+            "max_backoff_seconds": ("MAX_BACKOFF_SECONDS", int, "3600"),
+            "daily_post_limit": ("DAILY_POST_LIMIT", int, "100"),
+            "daily_comment_limit": ("DAILY_COMMENT_LIMIT", int, "50"),
+            "error_log_cap": ("ERROR_LOG_CAP", int, "100"),
+        }
+        return cls(**{
+            field: cast(os.getenv(env, default))
+            for field, (env, cast, default) in schema.items()
+        })
@@ -2,14 +2,32 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from src.config.config import Config
-from src.browser.facebook_automation_workflow import BrowserDriver
 from src.poster.facebook_poster import FacebookPoster
 from src.utils.url_utils import URLUtils
 from src.scraper.article import ArticleScraper
 from src.utils.logger import app_logger
-import time, random, os
-from typing import List, Dict, Optional, Tuple
-from retrying import retry
+import time, random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+if TYPE_CHECKING:
+    from src.browser.driver import BrowserDriver
+    from src.browser.driver_pool import DriverPool
+
+def _give_up_on_stale(retry_state) -> None:
+    app_logger.warning("%s: element still stale after %d attempts", retry_state.fn.__name__, retry_state.attempt_number)
+    return None
+
+# Only stale references are worth retrying; a missing element won't appear on a re-run
+_retry_on_stale = retry(
+    retry=retry_if_exception_type(StaleElementReferenceException),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.2, max=2),
+    retry_error_callback=_give_up_on_stale
+)
 
 class FacebookScraper:
     """Handles Facebook login and post scraping."""
@@ -23,59 +41,88 @@ class FacebookScraper:
     CSS_SELECTOR_AUTHOR_COMMENT = 'div[role="article"][aria-label][tabindex="-1"]'
     CSS_SELECTOR_AUTHOR_COMMENT_LINK = 'span[dir="auto"][lang]'
     CSS_SELECTOR_IMAGEPOST = 'div[class][style*="background-color"][style*="background-image"]'
+    # Where a post's text may be, in order of preference; the last one is an image post
+    POST_TEXT_SELECTORS = [CSS_SELECTOR_POST_TEXT, 'div[role="article"] div[dir="auto"]', CSS_SELECTOR_IMAGEPOST]
+    ARTICLE_LINK_SELECTORS = [CSS_SELECTOR_LINK_POST_TEXT, 'a[href*="http"][role="link"]']
     CSS_SELECTOR_POST_ID_ELEMENT = 'span > a[target="_blank"][role="link"]'
     CSS_SELECTOR_POST_ID_ON_HOVER = 'a[href*="/posts/"][role="link"]'
-
-    def __init__(self, driver: BrowserDriver, is_testing: bool = False):
+    # Posts opened at once in parallel tabs by scrape_posts
+    TAB_BATCH_SIZE = 4
+
+    def __init__(
+        self,
+        driver: "BrowserDriver",
+        is_testing: bool = False,
+        driver_pool: Optional["DriverPool"] = None,
+        article_scraper: Optional[ArticleScraper] = None
+    ):
         self.driver = driver
+        # Built once: Goose loads its stopword lists and parsers on creation
+        self.article_scraper = article_scraper or ArticleScraper()
+        # Extra logged-in browsers for scrape_pages; optional
+        self.driver_pool = driver_pool
         self.url_utils = URLUtils()
         self.is_testing = is_testing
 
+    @cached_property
+    def _cookie_file(self) -> Path:
+        """Where the session cookies of the configured account are saved."""
+        return Config.COOKIE_DIR / f"{Config.FB_EMAIL.replace('@', '_at_').replace('.', '_dot_')}.json"
+
     def login(self) -> bool:
         """Log in to Facebook with robust verification handling."""
-        cookie_file = Config.COOKIE_DIR / f"{Config.FB_EMAIL.replace('@', '_at_').replace('.', '_dot_')}.pkl"
+        cookie_file = self._cookie_file
         max_attempts = 3
         attempt = 0
 
         while attempt < max_attempts:
             attempt += 1
-            app_logger.info(f"Login attempt {attempt}/{max_attempts}")
+            app_logger.info("Login attempt %d/%d", attempt, max_attempts)
 
             # Try loading cookies
             try:
-                if cookie_file.exists():
+                # A single stat tells both whether the file exists and how old it is
+                try:
+                    cookie_age = time.time() - cookie_file.stat().st_mtime
+                except FileNotFoundError:
+                    cookie_age = None
+                if cookie_age is not None and cookie_age > Config.COOKIE_MAX_AGE:
+                    app_logger.info("Saved session is too old; logging in again")
+                    cookie_file.unlink(missing_ok=True)
+                    cookie_age = None
+                if cookie_age is not None:
                     try:
+                        # Leaves the browser on Facebook with the restored session
                         self.driver.load_cookies(cookie_file)
-                        self.driver.get(Config.SOURCE_URL)
-                        time.sleep(random.uniform(1, 2))
 
-                        # Check if login is required (invalid session)
-                        if self._is_login_prompt_present() or "two_step_verification" in self.driver.driver.current_url:
+                        # One probe tells whether a login is required (invalid session) or it succeeded
+                        state = self._probe_login_state()
+                        if self._is_login_prompt_present(state) or "two_step_verification" in self.driver.driver.current_url:
                             app_logger.warning("Invalid session detected; deleting cookies")
-                            os.remove(cookie_file)
+                            cookie_file.unlink(missing_ok=True)
                         else:
                             # Verify login success
-                            if self._is_login_successful():
+                            if self._is_login_successful(state):
                                 app_logger.info("Login successful via cookies")
                                 return True
                             app_logger.warning("Navigation bar not found; session invalid")
-                            os.remove(cookie_file)
+                            cookie_file.unlink(missing_ok=True)
                     except Exception as e:
-                        app_logger.warning(f"Cookie loading failed: {str(e)}")
-                        if cookie_file.exists():
-                            os.remove(cookie_file)
+                        app_logger.warning("Cookie loading failed: %s", e)
+                        cookie_file.unlink(missing_ok=True)
 
                 # Perform fresh login
                 self.driver.get(Config.SOURCE_URL)
-                time.sleep(random.uniform(1, 2))
 
-                # Check for login elements
+                # Check for login elements (one wait for the whole form to render)
                 try:
-                    button = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_LOGIN_BUTTON, timeout=Config.TIMEOUT)
-                    email_field = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_EMAIL_FIELD)
-                    password_field = self.driver.find_element(By.ID, "pass")
+                    button, email_field, password_field = self.driver.find_all_present([
+                        (By.CSS_SELECTOR, self.CSS_SELECTOR_LOGIN_BUTTON),
+                        (By.CSS_SELECTOR, self.CSS_SELECTOR_EMAIL_FIELD),
+                        (By.ID, "pass"),
+                    ], timeout=Config.TIMEOUT)
                 except (TimeoutException, NoSuchElementException) as e:
-                    app_logger.error(f"Login elements not found: {str(e)}")
+                    app_logger.error("Login elements not found: %s", e)
                     continue
 
                 # Enter credentials
@@ -106,296 +153,387 @@ class FacebookScraper:
                     return True
                 else:
                     app_logger.warning("Login failed: navigation bar not found")
-                    if cookie_file.exists():
-                        os.remove(cookie_file)
+                    cookie_file.unlink(missing_ok=True)
                     continue
 
             except Exception as e:
-                app_logger.error(f"Login attempt failed: {str(e)}")
-                if cookie_file.exists():
-                    os.remove(cookie_file)
+                app_logger.error("Login attempt failed: %s", e)
+                cookie_file.unlink(missing_ok=True)
                 continue
 
-        app_logger.error(f"Login failed after {max_attempts} attempts")
+        app_logger.error("Login failed after %d attempts", max_attempts)
         raise Exception(f"Login failed after {max_attempts} attempts")
 
-    def _is_human_verification_present(self) -> bool:
+    # Elements that only a logged-in page shows
+    LOGIN_SUCCESS_STATES = ["navigation_bar", "news_feed", "search_bar"]
+
+    def _probe_login_state(self, timeout: float = 5, wait_for: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Check every login-related element in one script call.
+
+        Waits until one of `wait_for` (default: any of them) shows up. Right after
+        submitting the form the form itself is often still there, so callers waiting
+        for the outcome leave the login-form states out.
+        """
+        return self.driver.probe_elements({
+            "verification": (By.XPATH, self.XPATH_HUMAN_VERIFICATION),
+            "email_field": (By.CSS_SELECTOR, self.CSS_SELECTOR_EMAIL_FIELD),
+            "login_button": (By.CSS_SELECTOR, self.CSS_SELECTOR_LOGIN_BUTTON),
+            "navigation_bar": (By.CSS_SELECTOR, self.CSS_SELECTOR_NAVIGATION_BAR),
+            "news_feed": (By.CSS_SELECTOR, 'div[role="feed"]'),
+            "search_bar": (By.CSS_SELECTOR, 'input[aria-label="Search Facebook"]'),
+        }, timeout=timeout, wait_for=wait_for)
+
+    def _is_human_verification_present(self, state: Optional[Dict[str, bool]] = None) -> bool:
         """Check for human verification prompts."""
-        try:
-            self.driver.find_element(By.XPATH, self.XPATH_HUMAN_VERIFICATION, timeout=3)
+        state = state or self._probe_login_state(timeout=3, wait_for=["verification"] + self.LOGIN_SUCCESS_STATES)
+        if state["verification"]:
             app_logger.info("Human verification detected via XPath")
             return True
-        except TimeoutException:
-            return False
+        return False
 
-    def _is_login_prompt_present(self) -> bool:
+    def _is_login_prompt_present(self, state: Optional[Dict[str, bool]] = None) -> bool:
         """Check for login prompt (email field or login button)."""
-        try:
-            self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_EMAIL_FIELD, timeout=3)
+        state = state or self._probe_login_state(timeout=3)
+        if state["email_field"]:
             app_logger.info("Login prompt detected via email field")
             return True
-        except TimeoutException:
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_LOGIN_BUTTON, timeout=3)
-                app_logger.info("Login prompt detected via login button")
-                return True
-            except TimeoutException:
-                return False
+        if state["login_button"]:
+            app_logger.info("Login prompt detected via login button")
+            return True
+        return False
 
-    def _is_login_successful(self) -> bool:
+    def _is_login_successful(self, state: Optional[Dict[str, bool]] = None) -> bool:
         """Check if login was successful by looking for the navigation bar."""
-        try:
-            self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_NAVIGATION_BAR, timeout=5)
+        state = state or self._probe_login_state(wait_for=self.LOGIN_SUCCESS_STATES)
+        if state["navigation_bar"]:
             app_logger.info("Navigation bar found; login successful")
             
             # Remove any pop-ups or modals that might interfere
             time.sleep(1)
             self.driver.find_element(By.CSS_SELECTOR, "body").send_keys(Keys.ESCAPE)
             return True
-        except TimeoutException:
-            # Fallback: Check for news feed or search bar
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, 'div[role="feed"]', timeout=3)
-                app_logger.info("News feed found; login successful")
-                return True
-            except TimeoutException:
-                try:
-                    self.driver.find_element(By.CSS_SELECTOR, 'input[aria-label="Search Facebook"]', timeout=3)
-                    app_logger.info("Search bar found; login successful")
-                    return True
-                except TimeoutException:
-                    app_logger.warning("No login success indicators found")
-                    return False
+        # Fallback: Check for news feed or search bar
+        if state["news_feed"]:
+            app_logger.info("News feed found; login successful")
+            return True
+        if state["search_bar"]:
+            app_logger.info("Search bar found; login successful")
+            return True
+        app_logger.warning("No login success indicators found")
+        return False
                 
     def scroll_page(self, times: int = 3) -> None:
         """Scroll the page to load more posts."""
-        app_logger.info(f"Scrolling page {times} times")
+        app_logger.debug("Scrolling page %d times", times)
+        loaded = len(self.driver.driver.find_elements(By.CSS_SELECTOR, self.CSS_SELECTOR_ALL_POSTS))
         self.driver.scroll(times=times)
-        time.sleep(random.uniform(1, 2))
+        # Return as soon as the feed grows instead of sleeping a fixed time
+        self.driver.wait_for_count(By.CSS_SELECTOR, self.CSS_SELECTOR_ALL_POSTS, loaded + 1, timeout=3)
 
     def select_posts(self) -> List:
         """Select all visible post elements on the page."""
         try:
-            posts = self.driver.find_elements(By.CSS_SELECTOR, self.CSS_SELECTOR_ALL_POSTS, timeout=Config.TIMEOUT)
-            app_logger.info(f"Selected {len(posts)} posts")
+            # The feed keeps growing while it loads, so always query it fresh
+            posts = self.driver.find_elements(By.CSS_SELECTOR, self.CSS_SELECTOR_ALL_POSTS, timeout=Config.TIMEOUT, use_cache=False)
+            app_logger.debug("Selected %d posts", len(posts))
             return posts
         except TimeoutException:
             app_logger.warning("No posts found")
             return []
 
-    @retry(stop_max_attempt_number=3, wait_fixed=1000)
-    def extract_post_id(self, post_element) -> Optional[str]:
-        """Extract post ID by hovering over the post's link."""
+    @_retry_on_stale
+    def extract_post_id(self, post_element, link_element=None) -> Optional[str]:
+        """Extract post ID by hovering over the post's link.
+
+        Callers that already located the link (CSS_SELECTOR_POST_ID_ELEMENT) pass it
+        as `link_element` to save looking it up again.
+        """
         try:
-            link_element = post_element.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_ID_ELEMENT)
+            if link_element is None:
+                link_element = post_element.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_ID_ELEMENT)
             self.driver.scroll_to_element(link_element)
             self.driver.scroll(times=3)
             self.driver.hover_element(link_element)
             time.sleep(random.uniform(0.5, 1.5))
-            post_link_element = post_element.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_ID_ON_HOVER, timeout=Config.TIMEOUT)
+            with self.driver.implicit_wait(Config.TIMEOUT):
+                post_link_element = post_element.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_ID_ON_HOVER)
             post_link = post_link_element.get_attribute("href")
             post_id = self.url_utils.extract_post_id(post_link)
             if post_id:
-                app_logger.info(f"Extracted post ID: {post_id}")
+                app_logger.debug("Extracted post ID: %s", post_id)
             else:
                 app_logger.warning("Failed to extract post ID")
             return post_id
-        except (NoSuchElementException, StaleElementReferenceException):
+        except NoSuchElementException:
             app_logger.warning("Failed to extract post ID due to element issues")
             return None
 
+    def _extract_post_ids(self, post_elements: List) -> List[Optional[str]]:
+        """Read the post IDs of many posts with one script call, without hovering each one."""
+        try:
+            links = self.driver.extract_post_links_js(post_elements, self.CSS_SELECTOR_POST_ID_ON_HOVER)
+        except StaleElementReferenceException:
+            app_logger.warning("Feed changed while reading post links; falling back to hovering")
+            return [None] * len(post_elements)
+        return [self.url_utils.extract_post_id(link) if link else None for link in links]
+
     def scrape_posts(self, page_name: str, analyzer, poster, db) -> List[Dict]:
         self.driver.get(f"{Config.SOURCE_URL}{page_name}")
-        time.sleep(random.uniform(2, 3))
+        self.driver.wait_for_element(By.CSS_SELECTOR, self.CSS_SELECTOR_ALL_POSTS, timeout=Config.TIMEOUT)
         posts = []
+        # Seeded with one query for the page's processed posts, so earlier runs' posts are
+        # skipped before any work is done on them; new ones are written in bulk at the end
+        seen_ids = set() if self.is_testing else set(db.get_post_ids(page_name))
+        pending_inserts = []
+        try:
+            self._collect_posts(page_name, analyzer, poster, seen_ids, posts, pending_inserts)
+        finally:
+            if not self.is_testing:
+                db.insert_posts(pending_inserts)
+                db.update_posts_success([(post["post_id"], 1) for post in posts if post.get("commented")])
+
+        app_logger.info("Processed %d posts from %s", len(posts), page_name)
+        return posts
+
+    def _collect_posts(
+        self,
+        page_name: str,
+        analyzer,
+        poster,
+        seen_ids: set,
+        posts: List[Dict],
+        pending_inserts: List[Tuple[str, str, str, int]]
+    ) -> None:
+        """Scroll through a page and scrape its new posts into `posts`.
+
+        Posts in `seen_ids` are skipped, and every post attempted is added to it and
+        recorded in `pending_inserts`.
+        """
         scroll_count = 0
-        processed_ids = set()
         last_post_count = 0
-        main_window = self.driver.driver.current_window_handle
 
         # Initial post loading
         max_initial_attempts = 3
         for attempt in range(max_initial_attempts):
             loaded_posts = self.select_posts()
             if loaded_posts:
-                app_logger.info(f"Found {len(loaded_posts)} posts on attempt {attempt + 1}")
+                app_logger.info("Found %d posts on attempt %d", len(loaded_posts), attempt + 1)
                 break
-            app_logger.info(f"No posts found on attempt {attempt + 1}; scrolling")
+            app_logger.info("No posts found on attempt %d; scrolling", attempt + 1)
             self.scroll_page(times=2)
-            time.sleep(random.uniform(1, 2))
         else:
-            app_logger.warning(f"No posts loaded after {max_initial_attempts} attempts")
-            return posts
+            app_logger.warning("No posts loaded after %d attempts", max_initial_attempts)
+            return
 
         while len(posts) < Config.POST_LIMIT and scroll_count < Config.MAX_SCROLLS:
             scroll_count += 1
-            app_logger.info(f"Scroll iteration {scroll_count}/{Config.MAX_SCROLLS}")
+            app_logger.debug("Scroll iteration %d/%d", scroll_count, Config.MAX_SCROLLS)
 
             loaded_posts = self.select_posts()
             if len(loaded_posts) == last_post_count and len(posts) < Config.POST_LIMIT:
                 app_logger.info("No new posts; scrolling")
                 self.scroll_page(times=2)
-                time.sleep(random.uniform(1, 2))
                 loaded_posts = self.select_posts()
                 if len(loaded_posts) == last_post_count:
                     app_logger.warning("No new posts after scrolling; ending")
                     break
 
-            for post in loaded_posts[last_post_count:]:
-                last_post_count += 1
-                try:
-                    link_element = post.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_ID_ELEMENT)
-                    self.driver.scroll_to_element(link_element)
-                    post_id = self.extract_post_id(post)
-                    if not post_id or post_id in processed_ids:
+            new_posts = loaded_posts[last_post_count:]
+            last_post_count = len(loaded_posts)
+            batch = []
+            for post, post_id in zip(new_posts, self._extract_post_ids(new_posts)):
+                if not post_id:
+                    # Not in the DOM yet; fall back to a real hover for this post only
+                    try:
+                        post_id = self.extract_post_id(post)
+                    except Exception as e:
+                        app_logger.error("Error extracting post ID: %s", e)
                         continue
-                    processed_ids.add(post_id)
-
-                    # Open post in new tab
-                    self.driver.open_new_tab(f"{Config.SOURCE_URL}{page_name}/posts/{post_id}")
-                    app_logger.info(f"Processing post: {Config.SOURCE_URL}{page_name}/posts/{post_id}")
-
-                    if self.is_testing or db.insert_post(post_id, page_name, 0):
-                        post_data = self._scrape_single_post(None)
-                        if not post_data or post_data["post_id"] != post_id:
-                            self.driver.switch_to.window(main_window)
-                            continue
-
-                        # Analyze post
-                        analysis = analyzer.analyze(
-                            post_data["post_text"],
-                            post_data["link_text"],
-                            post_data["article_content"]
-                        )
-                        comment = f"Summary: {analysis['summary']}"
-                        if analysis["is_clickbait"]:
-                            comment += f"\nHidden Info: {analysis['hidden_info']}"
-
-                        # Comment
-                        if not self.is_testing:
-                            self._scroll_to_comment_box(None)
-                            if poster.comment_on_post(page_name, post_id, comment):
-                                db.update_post_success(post_id, 1)
-                            else:
-                                app_logger.warning(f"Failed to comment on post {post_id}")
-
-                        posts.append(post_data)
-                        self.driver.switch_to.window(main_window)
-                        self.driver.close_all_other_tabs(main_window)
-                        if len(posts) >= Config.POST_LIMIT:
-                            break
-                except Exception as e:
-                    app_logger.error(f"Error processing post {post_id}: {str(e)}")
-                    self.driver.switch_to.window(main_window)
-                    self.driver.close_all_other_tabs(main_window)
+                if not post_id or post_id in seen_ids:
                     continue
+                seen_ids.add(post_id)
+                pending_inserts.append((post_id, time.strftime('%Y-%m-%d %H:%M:%S'), page_name, 0))
+
+                # Posts are opened a few at a time, in tabs that load in parallel
+                batch.append(post_id)
+                if len(batch) >= self.TAB_BATCH_SIZE or len(posts) + len(batch) >= Config.POST_LIMIT:
+                    posts.extend(self._scrape_post_batch(page_name, batch, analyzer, poster))
+                    batch = []
+                    if len(posts) >= Config.POST_LIMIT:
+                        break
+            if batch:
+                posts.extend(self._scrape_post_batch(page_name, batch, analyzer, poster))
+
+    def _scrape_post_batch(self, page_name: str, post_ids: List[str], analyzer, poster) -> List[Dict]:
+        """Open a batch of posts in parallel tabs, scrape each, then analyze and comment on them.
+
+        The posts' articles download concurrently while the tabs are read, and the
+        batch is analyzed in a single request. The tabs are closed before commenting,
+        since the poster opens (and closes) tabs of its own.
+        """
+        urls = [f"{Config.SOURCE_URL}{page_name}/posts/{post_id}" for post_id in post_ids]
+        handles = self.driver.open_tabs_cdp(urls)
+        scraped = []
+        # Articles download in the background while the remaining tabs are read
+        article_fetches = {}
+        try:
+            for post_id, url, handle in zip(post_ids, urls, handles):
+                try:
+                    self.driver.driver.switch_to.window(handle)
+                    app_logger.debug("Processing post: %s", url)
+                    post_data = self._scrape_single_post()
+                    if post_data and post_data["post_id"] == post_id:
+                        scraped.append(post_data)
+                        if post_data["article_url"]:
+                            article_fetches[post_id] = self.article_scraper.submit(post_data["article_url"])
+                except Exception as e:
+                    app_logger.error("Error processing post %s: %s", post_id, e)
+        finally:
+            self.driver.close_tabs(handles)
 
-        app_logger.info(f"Processed {len(posts)} posts from {page_name}")
+        for post_data in scraped:
+            fetch = article_fetches.get(post_data["post_id"])
+            if fetch:
+                try:
+                    article_content = fetch.result()
+                except Exception as e:
+                    app_logger.error("Failed to fetch article %s: %s", post_data["article_url"], e)
+                    article_content = None
+                # Pages that need JavaScript still get a browser tab, one at a time
+                post_data["article_content"] = article_content or self._scrape_article_in_browser(post_data["article_url"])
+
+        # One analysis request for the whole batch
+        try:
+            analyses = analyzer.analyze_batch([
+                (post_data["post_text"], post_data["article_content"] or "") for post_data in scraped
+            ])
+        except Exception as e:
+            app_logger.error("Error analyzing posts: %s", e)
+            return []
+
+        posts = []
+        for post_data, analysis in zip(scraped, analyses):
+            post_id = post_data["post_id"]
+            try:
+                comment = analysis.get("output")
+
+                # Comment
+                if comment and not self.is_testing:
+                    if poster.comment_on_post(page_name, post_id, comment):
+                        post_data["commented"] = True
+                    else:
+                        app_logger.warning("Failed to comment on post %s", post_id)
+
+                posts.append(post_data)
+            except Exception as e:
+                app_logger.error("Error processing post %s: %s", post_id, e)
         return posts
 
-    @retry(stop_max_attempt_number=3, wait_fixed=1000)
-    def _scrape_single_post(self, post_element) -> Optional[Dict]:
+    def scrape_pages(self, page_names: List[str], analyzer, db) -> Dict[str, List[Dict]]:
+        """Scrape several pages, in parallel when a driver pool is available.
+
+        Each page gets a browser of its own from the pool (and a poster bound to it),
+        so no browser is ever used by two threads.
+        """
+        if not self.driver_pool:
+            poster = FacebookPoster(self.driver)
+            return {page_name: self.scrape_posts(page_name, analyzer, poster, db) for page_name in page_names}
+
+        def scrape_page(page_name: str) -> List[Dict]:
+            with self.driver_pool.acquire() as driver:
+                scraper = FacebookScraper(driver, is_testing=self.is_testing, article_scraper=self.article_scraper)
+                return scraper.scrape_posts(page_name, analyzer, FacebookPoster(driver), db)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.driver_pool.size, len(page_names)) or 1) as executor:
+            futures = {executor.submit(scrape_page, page_name): page_name for page_name in page_names}
+            for future in as_completed(futures):
+                page_name = futures[future]
+                try:
+                    results[page_name] = future.result()
+                except Exception as e:
+                    app_logger.error("Failed to scrape page %s: %s", page_name, e)
+                    results[page_name] = []
+        return results
+
+    @_retry_on_stale
+    def _scrape_single_post(self) -> Optional[Dict]:
+        """Read the post open in the current tab; only its article's URL is looked up, the caller fetches the text."""
         try:
-            post_id = self.url_utils.extract_post_id(self.driver.driver.current_url) if not post_element else self.extract_post_id(post_element)
+            post_id = self.url_utils.extract_post_id(self.driver.driver.current_url)
             if not post_id:
                 return None
 
-            # Post text
-            try:
-                post_text = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_TEXT).text
-            except NoSuchElementException:
-                try:
-                    post_text = self.driver.find_element(By.CSS_SELECTOR, 'div[role="article"] div[dir="auto"]').text
-                except NoSuchElementException:
-                    try:
-                        div = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_IMAGEPOST)
-                        post_text = div.text.replace("\n", "").replace(self.url_utils.extract_url(div.text) or "", "")
-                    except NoSuchElementException:
-                        post_text = "-"
-                        app_logger.warning("Failed to extract post text")
+            # Post text; waits for the post to render
+            post_text = self._read_post_text(timeout=Config.TIMEOUT)
+            if not post_text:
+                app_logger.warning("Failed to extract post text")
 
             # Link text
-            try:
-                link_text = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_LINK_POST_TEXT).text
-                if link_text == post_text:
-                    link_text = "-"
-            except NoSuchElementException:
-                link_text = "-"
+            match = self.driver.first_match([self.CSS_SELECTOR_LINK_POST_TEXT])
+            link_text = match[1] if match and match[1] != post_text else "-"
 
-            # Article data
+            # Article URL
             try:
-                article_url, article_content = self._get_article_data(None)
-            except:
-                article_url, article_content = None, None
+                article_url = self._find_article_url(post_text)
+            except Exception as e:
+                app_logger.error("Error extracting article URL: %s", e)
+                article_url = None
+            if not article_url:
+                app_logger.warning("No article URL found")
+            post_text = post_text or "-"
 
             return {
                 "post_id": post_id,
                 "post_text": post_text,
                 "link_text": link_text,
                 "article_url": article_url,
-                "article_content": article_content
+                "article_content": None
             }
-        except (StaleElementReferenceException, NoSuchElementException):
+        except NoSuchElementException:
             app_logger.error("Failed to scrape post due to element issues")
             return None
 
-    def _get_article_data(self, post_element) -> Tuple[Optional[str], Optional[str]]:
-        article_scraper = ArticleScraper()
+    def _read_post_text(self, timeout: float = 0) -> str:
+        """Read the open post's text from the first of POST_TEXT_SELECTORS that has any; empty if none."""
+        match = self.driver.first_match(self.POST_TEXT_SELECTORS, timeout=timeout)
+        if not match:
+            return ""
+        index, text = match
+        if self.POST_TEXT_SELECTORS[index] == self.CSS_SELECTOR_IMAGEPOST:
+            # Image posts carry their link inside the text
+            url = self.url_utils.extract_url(text)
+            text = text.replace("\n", "").replace(url or "", "")
+        return text
+
+    def _find_article_url(self, post_text: str) -> Optional[str]:
+        """Find the open post's article: a link in the post, else a URL written in its text or image."""
+        match = self.driver.first_match(self.ARTICLE_LINK_SELECTORS, attr="href")
+        article_url = self.url_utils.extract_http_url(self.url_utils.unwrap_redirect(match[1])) if match else None
+        if not article_url:
+            article_url = self.url_utils.extract_url(post_text)
+        if not article_url:
+            match = self.driver.first_match([self.CSS_SELECTOR_IMAGEPOST])
+            article_url = self.url_utils.extract_url(match[1]) if match else None
+        return article_url
+
+    def _scrape_article_in_browser(self, article_url: str) -> Optional[str]:
+        """Load an article in a tab of its own and extract it; for pages plain HTTP gets nothing from."""
         main_window = self.driver.driver.current_window_handle
         try:
-            # Post text for URL
-            try:
-                post_text = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_POST_TEXT).text
-            except NoSuchElementException:
-                try:
-                    post_text = self.driver.find_element(By.CSS_SELECTOR, 'div[role="article"] div[dir="auto"]').text
-                except NoSuchElementException:
-                    try:
-                        div = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_IMAGEPOST)
-                        post_text = div.text.replace("\n", "").replace(self.url_utils.extract_url(div.text) or "", "")
-                    except NoSuchElementException:
-                        post_text = ""
-                        app_logger.warning("Failed to extract post text for article URL")
-
-            # Article URL
-            try:
-                link_element = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_LINK_POST_TEXT)
-                self.driver.scroll_to_element(link_element)
-                self.driver.hover_element(link_element)
-                article_url = link_element.get_attribute("href")
-                if not self.url_utils.is_valid_url(article_url):
-                    article_url = None
-            except NoSuchElementException:
-                try:
-                    link_element = self.driver.find_element(By.CSS_SELECTOR, 'a[href*="http"][role="link"]')
-                    article_url = link_element.get_attribute("href")
-                    if not self.url_utils.is_valid_url(article_url):
-                        article_url = None
-                except NoSuchElementException:
-                    article_url = self.url_utils.extract_url(post_text)
-                    if not article_url:
-                        try:
-                            div = self.driver.find_element(By.CSS_SELECTOR, self.CSS_SELECTOR_IMAGEPOST)
-                            article_url = self.url_utils.extract_url(div.text)
-                        except NoSuchElementException:
-                            article_url = None
-
-            if not article_url:
-                app_logger.warning("No article URL found")
-                return None, None
-
-            # Open article
+            # Only the article's own tab is closed afterwards, other batch tabs stay open
             self.driver.open_new_tab(article_url)
-            time.sleep(random.uniform(1, 2))
-            article_content = article_scraper.scrape_article(self.driver.driver.current_url)
-            self.driver.switch_to.window(main_window)
-            self.driver.close_all_other_tabs(main_window)
-            return article_url, article_content
+            article_tab = self.driver.driver.current_window_handle
+            try:
+                self.driver.wait_for_page_load(Config.TIMEOUT)
+                # Parse the DOM the browser rendered; fetching the URL again would get the same empty page
+                return self.article_scraper.parse_html(self.driver.driver.page_source) or None
+            finally:
+                self.driver.close_tabs([article_tab], switch_to=main_window)
         except Exception as e:
-            app_logger.error(f"Error extracting article data: {str(e)}")
-            self.driver.switch_to.window(main_window)
-            self.driver.close_all_other_tabs(main_window)
-            return None, None
+            app_logger.error("Error extracting article data: %s", e)
+            self.driver.driver.switch_to.window(main_window)
+            return None
 
     def _scroll_to_comment_box(self, post_element):
         """Scroll to the comment box to ensure it's interactable."""
@@ -411,10 +549,10 @@ class FacebookScraper:
         """Open a post's URL in a new tab."""
         try:
             post_url = f"{Config.SOURCE_URL}{page_name}/posts/{post_id}"
-            app_logger.info(f"Opening post URL in new tab: {post_url}")
+            app_logger.debug("Opening post URL in new tab: %s", post_url)
             self.driver.open_new_tab(post_url)
-            time.sleep(random.uniform(1, 2))
+            self.driver.wait_for_page_load(Config.TIMEOUT)
             return True
         except Exception as e:
-            app_logger.error(f"Failed to open post URL: {str(e)}")
+            app_logger.error("Failed to open post URL: %s", e)
             return False
\ No newline at end of file
@@ -1,4 +1,8 @@
+import atexit
+import copy
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 app_logger = logging.getLogger("facebook_scraper")
 app_logger.setLevel(logging.INFO)
@@ -8,4 +12,36 @@ handler = logging.StreamHandler()
 handler.setFormatter(logging.Formatter(
     "%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d in %(funcName)s - %(message)s"
 ))
-app_logger.addHandler(handler)
\ No newline at end of file
+
+# Renders tracebacks at enqueue time; its format string is never used
+_exc_formatter = logging.Formatter()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """QueueHandler that leaves line formatting to the listener and drops records instead of failing when the queue is full."""
+
+    def prepare(self, record):
+        # Freeze the message and traceback while args and frames are still as logged;
+        # the full line (time, location) is still formatted on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+# Callers only enqueue records; a background thread writes them to the stream
+log_queue = queue.Queue(maxsize=10000)
+app_logger.addHandler(_BoundedQueueHandler(log_queue))
+_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+_listener.start()
+# Flush whatever is still queued when the interpreter exits
+atexit.register(_listener.stop)
@@ -0,0 +1,47 @@
+import threading
+import time
+from typing import Optional
+
+
+class _LocalValue:
+    """Stand-in for multiprocessing.Value when the limiter is only shared between threads."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+class RateLimiter:
+    """Spaces out events (e.g. page loads on one host) by at least `interval` seconds.
+
+    Callers only wait when the previous event was too recent. Pass a multiprocessing
+    context to share the limiter with worker processes (through the pool initializer).
+    """
+
+    def __init__(self, interval: float, context=None):
+        self.interval = interval
+        if context is None:
+            self._lock = threading.Lock()
+            self._next_time = _LocalValue(0.0)
+        else:
+            self._lock = context.Lock()
+            self._next_time = context.Value("d", 0.0, lock=False)
+
+    def wait(self, shutdown_event: Optional[threading.Event] = None) -> bool:
+        """Block until the next event may start.
+
+        Returns:
+            bool: False if the shutdown event was set while waiting, True otherwise
+        """
+        # Reserve the next free slot under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time.value)
+            self._next_time.value = slot + self.interval
+        delay = slot - now
+        if delay <= 0:
+            return True
+        if shutdown_event is not None:
+            return not shutdown_event.wait(delay)
+        time.sleep(delay)
+        return True
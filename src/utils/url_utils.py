@@ -1,17 +1,73 @@
 import re
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qs, parse_qsl, urlencode
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"}
+
+# Supports: https://..., http://..., www..., domain.tld/...
+URL_RE = re.compile(r'(https?://\S+|www\.\S+|[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/\S*)?)')
+POST_ID_RE = re.compile(r'/posts/(pfbid\w+)')
+
+# Only explicit http(s) links; unlike extract_url it never mistakes prose for a domain
+HTTP_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
+
+@lru_cache(maxsize=2048)
+def _first_url(text: str) -> Optional[str]:
+    """Cached search for the first URL-like token in a text."""
+    match = URL_RE.search(text)
+    return match.group(0) if match else None
+
+
+@lru_cache(maxsize=2048)
+def _post_id(post_link: str) -> Optional[str]:
+    """Cached search for the post ID in a Facebook post URL."""
+    match = POST_ID_RE.search(post_link)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=2048)
+def _first_http_url(text: str) -> Optional[str]:
+    """Cached search for the first http(s) link in a text."""
+    match = HTTP_URL_RE.search(text)
+    # Punctuation right after a link usually belongs to the sentence
+    return match.group(0).rstrip(".,;:!?)") if match else None
+
 
 class URLUtils:
     """Utilities for extracting URLs and post IDs."""
     def extract_url(self, text: str) -> Optional[str]:
         """Extract the first URL from text (with or without www)."""
-        # Soporta: https://..., http://..., www..., dominio.tld/...
-        url_pattern = r'(https?://\S+|www\.\S+|[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/\S*)?)'
-        match = re.search(url_pattern, text)
-        return match.group(0) if match else None
+        return _first_url(text)
+
+    def extract_http_url(self, text: str) -> Optional[str]:
+        """Extract the first explicit http(s) URL from text."""
+        return _first_http_url(text)
 
     def extract_post_id(self, post_link: str) -> Optional[str]:
         """Extract post ID from a Facebook post URL."""
-        url_pattern = r'\/posts\/(pfbid\w+)'
-        match = re.search(url_pattern, post_link)
-        return match.group(1) if match else None
\ No newline at end of file
+        return _post_id(post_link)
+
+    def unwrap_redirect(self, url: str) -> str:
+        """Return the target of a Facebook outbound link (l.facebook.com/l.php?u=...), or the URL itself."""
+        parts = urlsplit(url)
+        if parts.netloc.endswith("facebook.com") and parts.path == "/l.php":
+            target = parse_qs(parts.query).get("u")
+            if target:
+                return target[0]
+        return url
+
+    def canonicalize_url(self, url: str) -> str:
+        """Normalize an article URL so shares of the same article compare equal.
+
+        Unwraps Facebook outbound links, lowercases the host, and drops the
+        fragment and tracking parameters (utm_*, fbclid, ...).
+        """
+        parts = urlsplit(self.unwrap_redirect(url.strip()))
+        query = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_") and key not in TRACKING_PARAMS
+        ]
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))